@@ -251,6 +251,9 @@ class ClaudeCodeBot:
                 await self.app.stop()
                 await self.app.shutdown()
 
+            # Let fire-and-forget storage/audit writes finish
+            await self.orchestrator.drain_background_tasks()
+
             logger.info("Bot stopped successfully")
         except Exception as e:
             logger.error("Error stopping bot", error=str(e))
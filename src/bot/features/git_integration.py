@@ -153,26 +153,28 @@ class GitIntegration:
         Returns:
             Git status information
         """
-        # Get branch and tracking info
-        branch_out, _ = await self.execute_git_command(
-            ["git", "branch", "--show-current"], repo_path
-        )
-        branch = branch_out.strip() or "HEAD"
-
-        # Get file status
+        # One porcelain call with --branch carries the branch name and the
+        # upstream ahead/behind counts in its "## " header line, so no
+        # separate branch or rev-list spawns are needed.
         status_out, _ = await self.execute_git_command(
-            ["git", "status", "--porcelain=v1"], repo_path
+            ["git", "status", "--porcelain=v1", "--branch"], repo_path
         )
 
+        branch = "HEAD"
+        ahead = behind = 0
         modified = []
         added = []
         deleted = []
         untracked = []
 
-        for line in status_out.strip().split("\n"):
+        for line in status_out.splitlines():
             if not line:
                 continue
 
+            if line.startswith("## "):
+                branch, ahead, behind = self._parse_branch_header(line[3:])
+                continue
+
             status = line[:2]
             filename = line[3:]
 
@@ -185,23 +187,6 @@ class GitIntegration:
             elif "D" in status:
                 deleted.append(filename)
 
-        # Get ahead/behind counts
-        ahead = behind = 0
-        try:
-            # Try to get upstream tracking info
-            rev_out, _ = await self.execute_git_command(
-                ["git", "rev-list", "--count", "--left-right", "HEAD...@{upstream}"],
-                repo_path,
-            )
-            if rev_out.strip():
-                parts = rev_out.strip().split("\t")
-                if len(parts) == 2:
-                    ahead = int(parts[0])
-                    behind = int(parts[1])
-        except GitError:
-            # No upstream configured
-            pass
-
         return GitStatus(
             branch=branch,
             modified=modified,
@@ -212,6 +197,32 @@ class GitIntegration:
             behind=behind,
         )
 
+    @staticmethod
+    def _parse_branch_header(header: str) -> Tuple[str, int, int]:
+        """Parse a porcelain ``## `` header into (branch, ahead, behind).
+
+        Examples: ``main...origin/main [ahead 1, behind 2]``, ``main``,
+        ``No commits yet on main`` and ``HEAD (no branch)``.
+        """
+        for prefix in ("No commits yet on ", "Initial commit on "):
+            if header.startswith(prefix):
+                return header[len(prefix) :], 0, 0
+
+        if header.startswith("HEAD (no branch)"):
+            return "HEAD", 0, 0
+
+        branch, _, tracking = header.partition("...")
+        ahead = behind = 0
+        _, _, counts = tracking.partition(" [")
+        for part in counts.rstrip("]").split(", "):
+            label, _, value = part.partition(" ")
+            if label == "ahead" and value.isdigit():
+                ahead = int(value)
+            elif label == "behind" and value.isdigit():
+                behind = int(value)
+
+        return branch or "HEAD", ahead, behind
+
     async def get_diff(
         self, repo_path: Path, staged: bool = False, file_path: Optional[str] = None
     ) -> str:
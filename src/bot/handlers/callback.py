@@ -1,5 +1,6 @@
 """Handle inline keyboard callbacks."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -18,11 +19,12 @@ logger = structlog.get_logger()
 
 def _is_within_root(path: Path, root: Path) -> bool:
     """Check whether path is within root directory."""
-    try:
-        path.resolve().relative_to(root.resolve())
-        return True
-    except ValueError:
-        return False
+    resolved = os.path.realpath(path)
+    resolved_root = os.path.realpath(root)
+    # The separator keeps /a/b from matching /a/bc
+    return resolved == resolved_root or resolved.startswith(
+        resolved_root.rstrip(os.sep) + os.sep
+    )
 
 
 def _get_thread_project_root(
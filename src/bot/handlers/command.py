@@ -23,11 +23,12 @@ logger = structlog.get_logger()
 
 def _is_within_root(path: Path, root: Path) -> bool:
     """Check whether path is within root directory."""
-    try:
-        path.resolve().relative_to(root.resolve())
-        return True
-    except ValueError:
-        return False
+    resolved = os.path.realpath(path)
+    resolved_root = os.path.realpath(root)
+    # The separator keeps /a/b from matching /a/bc
+    return resolved == resolved_root or resolved.startswith(
+        resolved_root.rstrip(os.sep) + os.sep
+    )
 
 
 def _get_thread_project_root(
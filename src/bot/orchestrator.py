@@ -6,11 +6,13 @@ classic mode, delegates to existing full-featured handlers.
 """
 
 import asyncio
+import functools
+import os
 import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import structlog
 from telegram import (
@@ -33,7 +35,7 @@ from ..claude.sdk_integration import StreamUpdate
 from ..config.settings import Settings
 from ..projects import PrivateTopicsUnavailableError
 from .utils.draft_streamer import DraftStreamer, generate_draft_id
-from .utils.html_format import escape_html
+from .utils.html_format import escape_html, strip_html_tags
 from .utils.image_extractor import (
     ImageAttachment,
     should_send_as_photo,
@@ -73,14 +75,19 @@ _SECRET_PATTERNS: List[re.Pattern[str]] = [
 ]
 
 
+def _redact_match(match: "re.Match[str]") -> str:
+    """Keep a match's first captured prefix and mask the rest."""
+    for group in match.groups():
+        if group is not None:
+            return group + "***"
+    return "***"
+
+
 def _redact_secrets(text: str) -> str:
     """Replace likely secrets/credentials with redacted placeholders."""
     result = text
     for pattern in _SECRET_PATTERNS:
-        result = pattern.sub(
-            lambda m: next((g + "***" for g in m.groups() if g is not None), "***"),
-            result,
-        )
+        result = pattern.sub(_redact_match, result)
     return result
 
 
@@ -110,6 +117,78 @@ def _tool_icon(name: str) -> str:
     return _TOOL_ICONS.get(name, "\U0001f527")
 
 
+@functools.lru_cache(maxsize=128)
+def _tool_label(name: str) -> str:
+    """Return the icon-prefixed tool label, e.g. ``"📖 Read"``."""
+    return f"{_tool_icon(name)} {name}"
+
+
+def _summarize_file_input(tool_input: Dict[str, Any]) -> Optional[str]:
+    path = tool_input.get("file_path") or tool_input.get("path", "")
+    if not path:
+        return None
+    # Show just the filename, not the full path (rfind is -1 if there is
+    # no slash, so the slice then keeps the whole path)
+    return path[path.rfind("/") + 1 :]
+
+
+def _summarize_pattern_input(tool_input: Dict[str, Any]) -> Optional[str]:
+    pattern = tool_input.get("pattern", "")
+    return pattern[:60] if pattern else None
+
+
+def _summarize_bash_input(tool_input: Dict[str, Any]) -> Optional[str]:
+    cmd = tool_input.get("command", "")
+    return _redact_secrets(cmd[:100])[:80] if cmd else None
+
+
+def _summarize_web_input(tool_input: Dict[str, Any]) -> Optional[str]:
+    return (tool_input.get("url", "") or tool_input.get("query", ""))[:60]
+
+
+def _summarize_task_input(tool_input: Dict[str, Any]) -> Optional[str]:
+    desc = tool_input.get("description", "")
+    return desc[:60] if desc else None
+
+
+# Per-tool input summarizers; None falls back to the generic summary
+_TOOL_INPUT_SUMMARIZERS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    "Read": _summarize_file_input,
+    "Write": _summarize_file_input,
+    "Edit": _summarize_file_input,
+    "MultiEdit": _summarize_file_input,
+    "Glob": _summarize_pattern_input,
+    "Grep": _summarize_pattern_input,
+    "Bash": _summarize_bash_input,
+    "WebFetch": _summarize_web_input,
+    "WebSearch": _summarize_web_input,
+    "Task": _summarize_task_input,
+}
+
+
+# MIME families that are binary, except for their text-based subtypes such
+# as image/svg+xml; such uploads are rejected before downloading them in
+# the plain-text fallback path.
+_BINARY_MIME_PREFIXES = ("image/", "audio/", "video/", "font/")
+_TEXT_MIME_SUFFIXES = ("+xml", "+json")
+
+
+def _is_binary_mime(mime_type: Optional[str]) -> bool:
+    """Return True if *mime_type* cannot be a UTF-8 text upload."""
+    mime_type = (mime_type or "").lower()
+    return mime_type.startswith(_BINARY_MIME_PREFIXES) and not mime_type.endswith(
+        _TEXT_MIME_SUFFIXES
+    )
+
+
+# Background storage/audit writes allowed to run at once
+_BACKGROUND_WRITE_CONCURRENCY = 4
+
+# Callback data patterns, compiled once and shared across handler registrations
+_STOP_CALLBACK_PATTERN = re.compile(r"^stop:")
+_CD_CALLBACK_PATTERN = re.compile(r"^cd:")
+
+
 @dataclass
 class ActiveRequest:
     """Tracks an in-flight Claude request so it can be interrupted."""
@@ -127,6 +206,48 @@ class MessageOrchestrator:
         self.settings = settings
         self.deps = deps
         self._active_requests: Dict[int, ActiveRequest] = {}
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+        self._background_semaphore = asyncio.Semaphore(_BACKGROUND_WRITE_CONCURRENCY)
+        # Throttled progress edits still in flight, keyed by id(progress_msg)
+        self._progress_edits: Dict[int, "asyncio.Task[None]"] = {}
+
+    def _run_in_background(
+        self, awaitable: Awaitable[Any], failure_message: str
+    ) -> None:
+        """Run a non-critical write (storage, audit) without blocking the reply.
+
+        A reference to the task is kept until it finishes so it is not
+        garbage-collected mid-flight; failures are logged, never raised.
+        At most _BACKGROUND_WRITE_CONCURRENCY writes run at once.
+        """
+
+        async def _runner() -> None:
+            async with self._background_semaphore:
+                try:
+                    await awaitable
+                except Exception as e:
+                    logger.warning(failure_message, error=str(e))
+
+        task = asyncio.create_task(_runner())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def drain_background_tasks(self) -> None:
+        """Wait for all pending background writes to complete."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _cancel_progress_edit(self, progress_msg: Any) -> None:
+        """Cancel a pending stream progress edit of *progress_msg*.
+
+        Must run before the progress message is edited or deleted after a
+        run, so a late "Working..." edit cannot overwrite the final text or
+        bring back the Stop button.
+        """
+        task = self._progress_edits.pop(id(progress_msg), None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
     def _inject_deps(self, handler: Callable) -> Callable:  # type: ignore[type-arg]
         """Wrap handler to inject dependencies into context.bot_data."""
@@ -360,7 +481,7 @@ class MessageOrchestrator:
         app.add_handler(
             CallbackQueryHandler(
                 self._inject_deps(self._handle_stop_callback),
-                pattern=r"^stop:",
+                pattern=_STOP_CALLBACK_PATTERN,
             )
         )
 
@@ -368,7 +489,7 @@ class MessageOrchestrator:
         app.add_handler(
             CallbackQueryHandler(
                 self._inject_deps(self._agentic_callback),
-                pattern=r"^cd:",
+                pattern=_CD_CALLBACK_PATTERN,
             )
         )
 
@@ -610,6 +731,8 @@ class MessageOrchestrator:
 
         elapsed = time.time() - start_time
         lines: List[str] = [f"Working... ({elapsed:.0f}s)\n"]
+        if len(activity_log) > 15:
+            lines.append(f"... ({len(activity_log) - 15} earlier entries)\n")
 
         for entry in activity_log[-15:]:  # Show last 15 entries max
             kind = entry.get("kind", "tool")
@@ -623,14 +746,12 @@ class MessageOrchestrator:
                     lines.append(f"\U0001f4ac {snippet[:80]}")
             else:
                 # Tool call
-                icon = _tool_icon(entry["name"])
-                if verbose_level >= 2 and entry.get("detail"):
-                    lines.append(f"{icon} {entry['name']}: {entry['detail']}")
+                label = _tool_label(entry["name"])
+                detail = entry.get("detail")
+                if verbose_level >= 2 and detail:
+                    lines.append(f"{label}: {detail}")
                 else:
-                    lines.append(f"{icon} {entry['name']}")
-
-        if len(activity_log) > 15:
-            lines.insert(1, f"... ({len(activity_log) - 15} earlier entries)\n")
+                    lines.append(label)
 
         return "\n".join(lines)
 
@@ -639,25 +760,11 @@ class MessageOrchestrator:
         """Return a short summary of tool input for verbose level 2."""
         if not tool_input:
             return ""
-        if tool_name in ("Read", "Write", "Edit", "MultiEdit"):
-            path = tool_input.get("file_path") or tool_input.get("path", "")
-            if path:
-                # Show just the filename, not the full path
-                return path.rsplit("/", 1)[-1]
-        if tool_name in ("Glob", "Grep"):
-            pattern = tool_input.get("pattern", "")
-            if pattern:
-                return pattern[:60]
-        if tool_name == "Bash":
-            cmd = tool_input.get("command", "")
-            if cmd:
-                return _redact_secrets(cmd[:100])[:80]
-        if tool_name in ("WebFetch", "WebSearch"):
-            return (tool_input.get("url", "") or tool_input.get("query", ""))[:60]
-        if tool_name == "Task":
-            desc = tool_input.get("description", "")
-            if desc:
-                return desc[:60]
+        summarize = _TOOL_INPUT_SUMMARIZERS.get(tool_name)
+        if summarize is not None:
+            summary = summarize(tool_input)
+            if summary is not None:
+                return summary
         # Generic: show first key's value
         for v in tool_input.values():
             if isinstance(v, str) and v:
@@ -721,6 +828,19 @@ class MessageOrchestrator:
             return None
 
         last_edit_time = [0.0]  # mutable container for closure
+        # tool_log is append-only, so its length identifies what was last shown
+        last_rendered_len = [0]
+        edit_key = id(progress_msg)
+
+        def _forget_edit(task: "asyncio.Task[None]") -> None:
+            if self._progress_edits.get(edit_key) is task:
+                del self._progress_edits[edit_key]
+
+        async def _edit_progress(text: str) -> None:
+            try:
+                await progress_msg.edit_text(text, reply_markup=reply_markup)
+            except Exception:
+                pass
 
         async def _on_stream(update_obj: StreamUpdate) -> None:
             # Stop all streaming activity after interrupt
@@ -755,26 +875,20 @@ class MessageOrchestrator:
                             {"kind": "tool", "name": name, "detail": detail}
                         )
                     if draft_streamer:
-                        icon = _tool_icon(name)
-                        line = (
-                            f"{icon} {name}: {detail}" if detail else f"{icon} {name}"
-                        )
+                        label = _tool_label(name)
+                        line = f"{label}: {detail}" if detail else label
                         await draft_streamer.append_tool(line)
 
             # Capture assistant text (reasoning / commentary)
             if update_obj.type == "assistant" and update_obj.content:
-                text = update_obj.content.strip()
-                if text:
-                    first_line = text.split("\n", 1)[0].strip()
-                    if first_line:
-                        if verbose_level >= 1:
-                            tool_log.append(
-                                {"kind": "text", "detail": first_line[:120]}
-                            )
-                        if draft_streamer:
-                            await draft_streamer.append_tool(
-                                f"\U0001f4ac {first_line[:120]}"
-                            )
+                first_line = update_obj.content.lstrip().partition("\n")[0].strip()
+                if first_line:
+                    if verbose_level >= 1:
+                        tool_log.append({"kind": "text", "detail": first_line[:120]})
+                    if draft_streamer:
+                        await draft_streamer.append_tool(
+                            f"\U0001f4ac {first_line[:120]}"
+                        )
 
             # Stream text to user via draft (prefer token deltas;
             # skip full assistant messages to avoid double-appending)
@@ -782,20 +896,25 @@ class MessageOrchestrator:
                 if update_obj.type == "stream_delta":
                     await draft_streamer.append_text(update_obj.content)
 
-            # Throttle progress message edits to avoid Telegram rate limits
+            # Throttle progress message edits to avoid Telegram rate limits.
+            # Edits run as a background task so a slow editMessageText never
+            # stalls the stream; while one is in flight, later updates are
+            # coalesced into the next edit.
             if not draft_streamer and verbose_level >= 1:
                 now = time.time()
-                if (now - last_edit_time[0]) >= 2.0 and tool_log:
+                if (
+                    edit_key not in self._progress_edits
+                    and now - last_edit_time[0] >= 2.0
+                    and len(tool_log) != last_rendered_len[0]
+                ):
                     last_edit_time[0] = now
+                    last_rendered_len[0] = len(tool_log)
                     new_text = self._format_verbose_progress(
                         tool_log, verbose_level, start_time
                     )
-                    try:
-                        await progress_msg.edit_text(
-                            new_text, reply_markup=reply_markup
-                        )
-                    except Exception:
-                        pass
+                    task = asyncio.create_task(_edit_progress(new_text))
+                    self._progress_edits[edit_key] = task
+                    task.add_done_callback(_forget_edit)
 
         return _on_stream
 
@@ -817,7 +936,7 @@ class MessageOrchestrator:
         photos: List[ImageAttachment] = []
         documents: List[ImageAttachment] = []
         for img in images:
-            if should_send_as_photo(img.path):
+            if should_send_as_photo(img.path, img.size):
                 photos.append(img)
             else:
                 documents.append(img)
@@ -1005,19 +1124,19 @@ class MessageOrchestrator:
                 claude_response, context, self.settings, user_id
             )
 
-            # Store interaction
+            # Store interaction (off the reply path)
             storage = context.bot_data.get("storage")
             if storage:
-                try:
-                    await storage.save_claude_interaction(
+                self._run_in_background(
+                    storage.save_claude_interaction(
                         user_id=user_id,
                         session_id=claude_response.session_id,
                         prompt=message_text,
                         response=claude_response,
                         ip_address=None,
-                    )
-                except Exception as e:
-                    logger.warning("Failed to log interaction", error=str(e))
+                    ),
+                    "Failed to log interaction",
+                )
 
             # Format response (no reply_markup — strip keyboards)
             from .utils.formatting import ResponseFormatter
@@ -1044,6 +1163,7 @@ class MessageOrchestrator:
         finally:
             heartbeat.cancel()
             self._active_requests.pop(user_id, None)
+            await self._cancel_progress_edit(progress_msg)
             if draft_streamer:
                 try:
                     await draft_streamer.flush()
@@ -1079,14 +1199,19 @@ class MessageOrchestrator:
             for i, message in enumerate(formatted_messages):
                 if not message.text or not message.text.strip():
                     continue
+                # Chunks that fail local validation go out as plain text up
+                # front; anything Telegram still rejects is retried below.
+                text = message.text
+                parse_mode: Optional[str] = message.parse_mode
+                if parse_mode == "HTML" and not message.validated:
+                    text, parse_mode = strip_html_tags(text), None
+                reply_to_message_id = update.message.message_id if i == 0 else None
                 try:
                     await update.message.reply_text(
-                        message.text,
-                        parse_mode=message.parse_mode,
+                        text,
+                        parse_mode=parse_mode,
                         reply_markup=None,  # No keyboards in agentic mode
-                        reply_to_message_id=(
-                            update.message.message_id if i == 0 else None
-                        ),
+                        reply_to_message_id=reply_to_message_id,
                     )
                     if i < len(formatted_messages) - 1:
                         await asyncio.sleep(0.5)
@@ -1098,20 +1223,17 @@ class MessageOrchestrator:
                     )
                     try:
                         await update.message.reply_text(
-                            message.text,
+                            strip_html_tags(message.text),
+                            parse_mode=None,
                             reply_markup=None,
-                            reply_to_message_id=(
-                                update.message.message_id if i == 0 else None
-                            ),
+                            reply_to_message_id=reply_to_message_id,
                         )
                     except Exception as plain_err:
                         await update.message.reply_text(
                             f"Failed to deliver response "
                             f"(Telegram error: {str(plain_err)[:150]}). "
                             f"Please try again.",
-                            reply_to_message_id=(
-                                update.message.message_id if i == 0 else None
-                            ),
+                            reply_to_message_id=reply_to_message_id,
                         )
 
             # Send images separately if caption wasn't used
@@ -1125,14 +1247,17 @@ class MessageOrchestrator:
                 except Exception as img_err:
                     logger.warning("Image send failed", error=str(img_err))
 
-        # Audit log
+        # Audit log (off the reply path)
         audit_logger = context.bot_data.get("audit_logger")
         if audit_logger:
-            await audit_logger.log_command(
-                user_id=user_id,
-                command="text_message",
-                args=[message_text[:100]],
-                success=success,
+            self._run_in_background(
+                audit_logger.log_command(
+                    user_id=user_id,
+                    command="text_message",
+                    args=[message_text[:100]],
+                    success=success,
+                ),
+                "Failed to write audit log",
             )
 
     async def agentic_document(
@@ -1141,6 +1266,7 @@ class MessageOrchestrator:
         """Process file upload -> Claude, minimal chrome."""
         user_id = update.effective_user.id
         document = update.message.document
+        verbose_level = self._get_verbose_level(context)
 
         logger.info(
             "Agentic document upload",
@@ -1185,6 +1311,11 @@ class MessageOrchestrator:
                 file_handler = None
 
         if not file_handler:
+            if document and _is_binary_mime(document.mime_type):
+                await progress_msg.edit_text(
+                    "Unsupported file format. Must be text-based (UTF-8)."
+                )
+                return
             file = await document.get_file()
             file_bytes = await file.download_as_bytearray()
             try:
@@ -1219,7 +1350,6 @@ class MessageOrchestrator:
         # Flag is only cleared after a successful run so retries keep the intent.
         force_new = bool(context.user_data.get("force_new_session"))
 
-        verbose_level = self._get_verbose_level(context)
         tool_log: List[Dict[str, Any]] = []
         mcp_images_doc: List[ImageAttachment] = []
         on_stream = self._make_stream_callback(
@@ -1260,6 +1390,7 @@ class MessageOrchestrator:
                 claude_response.content
             )
 
+            await self._cancel_progress_edit(progress_msg)
             try:
                 await progress_msg.delete()
             except Exception:
@@ -1309,6 +1440,7 @@ class MessageOrchestrator:
         except Exception as e:
             from .handlers.message import _format_error_message
 
+            await self._cancel_progress_edit(progress_msg)
             await progress_msg.edit_text(_format_error_message(e), parse_mode="HTML")
             logger.error("Claude file processing failed", error=str(e), user_id=user_id)
         finally:
@@ -1319,6 +1451,7 @@ class MessageOrchestrator:
     ) -> None:
         """Process photo -> Claude, minimal chrome."""
         user_id = update.effective_user.id
+        verbose_level = self._get_verbose_level(context)
 
         features = context.bot_data.get("features")
         image_handler = features.get_image_handler() if features else None
@@ -1343,6 +1476,7 @@ class MessageOrchestrator:
                 progress_msg=progress_msg,
                 user_id=user_id,
                 chat=chat,
+                verbose_level=verbose_level,
             )
 
         except Exception as e:
@@ -1358,6 +1492,7 @@ class MessageOrchestrator:
     ) -> None:
         """Transcribe voice message -> Claude, minimal chrome."""
         user_id = update.effective_user.id
+        verbose_level = self._get_verbose_level(context)
 
         features = context.bot_data.get("features")
         voice_handler = features.get_voice_handler() if features else None
@@ -1384,6 +1519,7 @@ class MessageOrchestrator:
                 progress_msg=progress_msg,
                 user_id=user_id,
                 chat=chat,
+                verbose_level=verbose_level,
             )
 
         except Exception as e:
@@ -1403,8 +1539,13 @@ class MessageOrchestrator:
         progress_msg: Any,
         user_id: int,
         chat: Any,
+        verbose_level: Optional[int] = None,
     ) -> None:
-        """Run a media-derived prompt through Claude and send responses."""
+        """Run a media-derived prompt through Claude and send responses.
+
+        *verbose_level* is the level already resolved by the calling handler;
+        it is looked up from *context* only when not supplied.
+        """
         claude_integration = context.bot_data.get("claude_integration")
         if not claude_integration:
             await progress_msg.edit_text(
@@ -1418,7 +1559,8 @@ class MessageOrchestrator:
         session_id = context.user_data.get("claude_session_id")
         force_new = bool(context.user_data.get("force_new_session"))
 
-        verbose_level = self._get_verbose_level(context)
+        if verbose_level is None:
+            verbose_level = self._get_verbose_level(context)
         tool_log: List[Dict[str, Any]] = []
         mcp_images_media: List[ImageAttachment] = []
         on_stream = self._make_stream_callback(
@@ -1442,6 +1584,7 @@ class MessageOrchestrator:
             )
         finally:
             heartbeat.cancel()
+            await self._cancel_progress_edit(progress_msg)
 
         if force_new:
             context.user_data["force_new_session"] = False
@@ -1563,14 +1706,15 @@ class MessageOrchestrator:
 
         # No args — list repos
         try:
-            entries = sorted(
-                [
-                    d
-                    for d in base.iterdir()
-                    if d.is_dir() and not d.name.startswith(".")
-                ],
-                key=lambda d: d.name,
-            )
+            # DirEntry.is_dir() answers from the directory listing itself,
+            # so only symlinked entries cost an extra stat.
+            with os.scandir(base) as it:
+                names = sorted(
+                    entry.name
+                    for entry in it
+                    if not entry.name.startswith(".") and entry.is_dir()
+                )
+            entries = [base / name for name in names]
         except OSError as e:
             await update.message.reply_text(f"Error reading workspace: {e}")
             return
@@ -1615,7 +1759,7 @@ class MessageOrchestrator:
     ) -> None:
         """Handle stop: callbacks — interrupt a running Claude request."""
         query = update.callback_query
-        target_user_id = int(query.data.split(":", 1)[1])
+        target_user_id = int(query.data.partition(":")[2])
 
         # Only the requesting user can stop their own request
         if query.from_user.id != target_user_id:
@@ -1636,6 +1780,7 @@ class MessageOrchestrator:
         active.interrupted = True
         await query.answer("Stopping...", show_alert=False)
 
+        await self._cancel_progress_edit(active.progress_msg)
         try:
             await active.progress_msg.edit_text("Stopping...", reply_markup=None)
         except Exception:
@@ -1648,8 +1793,7 @@ class MessageOrchestrator:
         query = update.callback_query
         await query.answer()
 
-        data = query.data
-        _, project_name = data.split(":", 1)
+        _, _, project_name = query.data.partition(":")
 
         base = self.settings.approved_directory
         new_path = base / project_name
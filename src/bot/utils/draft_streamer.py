@@ -59,7 +59,10 @@ class DraftStreamer:
         self.throttle_interval = throttle_interval
 
         self._tool_lines: List[str] = []
+        # Rendered tool header, reused until the next tool line arrives
+        self._tool_header: Optional[str] = None
         self._accumulated_text = ""
+        self._last_sent_text: Optional[str] = None
         self._last_send_time = 0.0
         self._enabled = True
 
@@ -68,6 +71,7 @@ class DraftStreamer:
         if not self._enabled or not line:
             return
         self._tool_lines.append(line)
+        self._tool_header = None
         now = time.time()
         if (now - self._last_send_time) >= self.throttle_interval:
             await self._send_draft()
@@ -89,33 +93,47 @@ class DraftStreamer:
             return
         await self._send_draft()
 
-    def _compose_draft(self) -> str:
-        """Combine tool header and response body into a single draft."""
+    def _render_tool_header(self) -> str:
+        """Render the last tool lines, with an overflow count if needed."""
         parts: List[str] = []
+        overflow = len(self._tool_lines) - _MAX_TOOL_LINES
+        if overflow >= 3:
+            parts.append(f"... +{overflow} more")
+        parts.extend(self._tool_lines[-_MAX_TOOL_LINES:])
+        return "\n".join(parts)
 
-        if self._tool_lines:
-            visible = self._tool_lines[-_MAX_TOOL_LINES:]
-            overflow = len(self._tool_lines) - _MAX_TOOL_LINES
-            if overflow >= 3:
-                parts.append(f"... +{overflow} more")
-            parts.extend(visible)
-
-        if self._accumulated_text:
-            if parts:
-                parts.append("")  # blank separator line
-            parts.append(self._accumulated_text)
+    def _compose_draft(self) -> str:
+        """Combine tool header and response body into a single draft.
 
-        return "\n".join(parts)
+        Drafts over the Telegram limit are tail-truncated behind an
+        ellipsis; only the visible tail of the response text is copied.
+        """
+        header = ""
+        if self._tool_lines:
+            if self._tool_header is None:
+                self._tool_header = self._render_tool_header()
+            header = self._tool_header
+
+        text = self._accumulated_text
+        # Blank separator line between tools and text
+        sep = "\n\n" if header and text else ""
+        if len(header) + len(sep) + len(text) <= TELEGRAM_MAX_MESSAGE_LENGTH:
+            return "".join((header, sep, text))
+
+        budget = TELEGRAM_MAX_MESSAGE_LENGTH - 1
+        if len(text) >= budget:
+            return "".join(("\u2026", text[-budget:]))
+        lead = header + sep
+        return "".join(("\u2026", lead[len(text) - budget :], text))
 
     async def _send_draft(self) -> None:
         """Send the composed draft (tools + text) as a message draft."""
         draft_text = self._compose_draft()
         if not draft_text.strip():
             return
-
-        # Tail-truncate if over Telegram limit
-        if len(draft_text) > TELEGRAM_MAX_MESSAGE_LENGTH:
-            draft_text = "\u2026" + draft_text[-(TELEGRAM_MAX_MESSAGE_LENGTH - 1) :]
+        # Telegram would just re-apply the same draft; skip the round trip
+        if draft_text == self._last_sent_text:
+            return
 
         try:
             kwargs = {
@@ -126,6 +144,7 @@ class DraftStreamer:
             if self.message_thread_id is not None:
                 kwargs["message_thread_id"] = self.message_thread_id
             await self.bot.send_message_draft(**kwargs)
+            self._last_sent_text = draft_text
             self._last_send_time = time.time()
         except Exception:
             logger.debug(
@@ -7,7 +7,11 @@ from typing import List, Optional
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from ...config.settings import Settings
-from .html_format import escape_html, markdown_to_telegram_html
+from .html_format import (
+    escape_html,
+    is_valid_telegram_html,
+    markdown_to_telegram_html,
+)
 
 
 @dataclass
@@ -17,6 +21,8 @@ class FormattedMessage:
     text: str
     parse_mode: str = "HTML"
     reply_markup: Optional[InlineKeyboardMarkup] = None
+    # False when the HTML is known to be malformed (e.g. a split cut a tag)
+    validated: bool = True
 
     def __len__(self) -> int:
         """Return length of message text."""
@@ -61,6 +67,10 @@ class ResponseFormatter:
         # Filter out any empty messages produced by formatting/splitting
         messages = [m for m in messages if m.text and m.text.strip()]
 
+        for message in messages:
+            if message.parse_mode == "HTML":
+                message.validated = is_valid_telegram_html(message.text)
+
         return (
             messages
             if messages
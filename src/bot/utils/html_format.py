@@ -5,9 +5,50 @@ ambiguous Markdown v1 metacharacters, making it far more robust for rendering
 Claude's output which contains underscores, asterisks, brackets, etc.
 """
 
+import html
 import re
 from typing import List, Tuple
 
+# Tags accepted by Telegram's HTML parse mode
+_TELEGRAM_TAGS = frozenset(
+    {
+        "a",
+        "b",
+        "blockquote",
+        "code",
+        "del",
+        "em",
+        "i",
+        "ins",
+        "pre",
+        "s",
+        "span",
+        "strike",
+        "strong",
+        "tg-emoji",
+        "tg-spoiler",
+        "u",
+    }
+)
+
+# Attributes Telegram honours, per tag; any other attribute is rejected
+_TELEGRAM_ATTRS = {
+    "a": frozenset({"href"}),
+    "blockquote": frozenset({"expandable"}),
+    "code": frozenset({"class"}),
+    "span": frozenset({"class"}),
+    "tg-emoji": frozenset({"emoji-id"}),
+}
+
+# A complete tag, a supported entity, or a bare "<" / "&" that starts neither
+_HTML_TOKEN_RE = re.compile(
+    r"<(/?)([A-Za-z][A-Za-z0-9-]*)((?:\s[^<>]*)?)>"
+    r"|&(?:lt|gt|amp|quot|#[0-9]+|#x[0-9A-Fa-f]+);"
+    r"|[<&]"
+)
+_HTML_ATTR_RE = re.compile(r'\s+([A-Za-z][A-Za-z0-9-]*)(?:="([^"]*)")?')
+_HTML_TAG_RE = re.compile(r"<[^<>]*>")
+
 
 def escape_html(text: str) -> str:
     """Escape the 3 HTML-special characters for Telegram.
@@ -102,3 +143,50 @@ def markdown_to_telegram_html(text: str) -> str:
         text = text.replace(key, html_content)
 
     return text
+
+
+def is_valid_telegram_html(text: str) -> bool:
+    """Return True if *text* should be accepted by Telegram's HTML parser.
+
+    Checks that only supported tags and attributes are used, that tags are
+    properly nested and closed, and that every ``<`` / ``&`` belongs to a
+    tag or to one of the entities Telegram understands.
+    Message splitting can cut through tags; such chunks fail this check.
+    """
+    stack: List[str] = []
+    for m in _HTML_TOKEN_RE.finditer(text):
+        token = m.group(0)
+        if token[0] == "&":
+            if len(token) == 1:
+                return False
+            continue
+        tag = m.group(2)
+        if tag is None:
+            return False
+        tag = tag.lower()
+        if tag not in _TELEGRAM_TAGS:
+            return False
+        if m.group(1):
+            if m.group(3).strip() or not stack or stack.pop() != tag:
+                return False
+        else:
+            if not _valid_attrs(tag, m.group(3)):
+                return False
+            stack.append(tag)
+    return not stack
+
+
+def _valid_attrs(tag: str, attrs: str) -> bool:
+    """Check that a tag's attributes are well-formed and allowed for it."""
+    allowed = _TELEGRAM_ATTRS.get(tag, frozenset())
+    pos = 0
+    for m in _HTML_ATTR_RE.finditer(attrs):
+        if m.start() != pos or m.group(1).lower() not in allowed:
+            return False
+        pos = m.end()
+    return not attrs[pos:].strip()
+
+
+def strip_html_tags(text: str) -> str:
+    """Remove HTML tags and unescape entities, yielding plain text."""
+    return html.unescape(_HTML_TAG_RE.sub("", text))
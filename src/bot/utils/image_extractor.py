@@ -5,9 +5,13 @@ validates each path via :func:`validate_image_path` and collects
 :class:`ImageAttachment` objects for later Telegram delivery.
 """
 
+import functools
+import os
+import stat
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import structlog
 
@@ -24,6 +28,9 @@ IMAGE_EXTENSIONS = {
     ".svg": "image/svg+xml",
 }
 
+# Suffix tuple for str.endswith() prefiltering before any filesystem access
+_IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)
+
 # Raster formats that can be sent via reply_photo() (Telegram supports these natively)
 TELEGRAM_PHOTO_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
 
@@ -32,6 +39,15 @@ MAX_IMAGES_PER_RESPONSE = 10
 MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024  # 50 MB
 PHOTO_SIZE_LIMIT = 10 * 1024 * 1024  # 10 MB — Telegram photo API limit
 
+# Paths that passed the containment check, keyed by (file_path, approved
+# directory) -> (resolved path, identity of file_path itself via lstat(),
+# identity of the resolved file). A hit is only trusted while both still
+# match, so retargeting a symlink or replacing the file invalidates it.
+_VALIDATED_CACHE_SIZE = 256
+_FileId = Tuple[int, int, int]
+_CacheEntry = Tuple[str, _FileId, _FileId]
+_validated_paths: "OrderedDict[Tuple[str, Path], _CacheEntry]" = OrderedDict()
+
 
 @dataclass
 class ImageAttachment:
@@ -40,6 +56,46 @@ class ImageAttachment:
     path: Path
     mime_type: str
     original_reference: str
+    size: Optional[int] = None  # bytes, captured when the path was validated
+
+
+@functools.lru_cache(maxsize=16)
+def _approved_prefix(directory: Path) -> str:
+    """Return the resolved directory with a trailing separator, cached.
+
+    The trailing separator keeps ``/a/b`` from matching ``/a/bc/...``.
+    """
+    return str(directory.resolve()).rstrip(os.sep) + os.sep
+
+
+def _file_id(file_stat: os.stat_result) -> _FileId:
+    """Identify a file by device, inode and change time."""
+    return file_stat.st_dev, file_stat.st_ino, file_stat.st_ctime_ns
+
+
+def _cached_validation(
+    key: Tuple[str, Path],
+) -> Optional[Tuple[str, os.stat_result]]:
+    """Return the resolved path and fresh stat for a still-valid cache entry."""
+    entry = _validated_paths.get(key)
+    if entry is None:
+        return None
+    resolved, path_id, target_id = entry
+    try:
+        path_id_now = _file_id(os.lstat(key[0]))
+        file_stat: Optional[os.stat_result] = os.stat(resolved)
+    except OSError:
+        file_stat = None
+    if (
+        file_stat is None
+        or path_id_now != path_id
+        or _file_id(file_stat) != target_id
+        or not stat.S_ISREG(file_stat.st_mode)
+    ):
+        del _validated_paths[key]
+        return None
+    _validated_paths.move_to_end(key)
+    return resolved, file_stat
 
 
 def validate_image_path(
@@ -53,57 +109,83 @@ def validate_image_path(
     inside *approved_directory*, or ``None`` otherwise.
     """
     try:
-        path = Path(file_path)
-        if not path.is_absolute():
+        if not os.path.isabs(file_path):
             return None
 
-        resolved = path.resolve()
-
-        # Security: must be within approved directory
-        try:
-            resolved.relative_to(approved_directory.resolve())
-        except ValueError:
-            logger.debug(
-                "MCP image path outside approved directory",
-                path=str(resolved),
-                approved=str(approved_directory),
-            )
+        # Reject non-image names before resolving or stat-ing anything
+        if not file_path.lower().endswith(_IMAGE_SUFFIXES):
             return None
 
-        if not resolved.is_file():
-            return None
-
-        file_size = resolved.stat().st_size
+        key = (file_path, approved_directory)
+        hit = _cached_validation(key)
+        if hit is not None:
+            resolved, file_stat = hit
+        else:
+            # Taken before resolving: if file_path is retargeted meanwhile,
+            # the stored identity is stale and the next lookup misses.
+            path_id = _file_id(os.lstat(file_path))
+
+            # Work on plain strings until the path is accepted; realpath still
+            # follows symlinks, so a link cannot escape the approved directory.
+            resolved = os.path.realpath(file_path)
+
+            # Security: must be within approved directory
+            if not resolved.startswith(_approved_prefix(approved_directory)):
+                logger.debug(
+                    "MCP image path outside approved directory",
+                    path=resolved,
+                    approved=str(approved_directory),
+                )
+                return None
+
+            # One stat() serves the regular-file check, the size cap and, via
+            # ImageAttachment.size, the later photo-vs-document decision.
+            try:
+                file_stat = os.stat(resolved)
+            except OSError:
+                return None
+            if not stat.S_ISREG(file_stat.st_mode):
+                return None
+
+            _validated_paths[key] = (resolved, path_id, _file_id(file_stat))
+            if len(_validated_paths) > _VALIDATED_CACHE_SIZE:
+                _validated_paths.popitem(last=False)
+
+        file_size = file_stat.st_size
         if file_size > MAX_FILE_SIZE_BYTES:
-            logger.debug("MCP image file too large", path=str(resolved), size=file_size)
+            logger.debug("MCP image file too large", path=resolved, size=file_size)
             return None
 
-        ext = resolved.suffix.lower()
+        ext = os.path.splitext(resolved)[1].lower()
         mime_type = IMAGE_EXTENSIONS.get(ext)
         if not mime_type:
             return None
 
         return ImageAttachment(
-            path=resolved,
+            path=Path(resolved),
             mime_type=mime_type,
             original_reference=caption or file_path,
+            size=file_size,
         )
     except (OSError, ValueError) as e:
         logger.debug("MCP image path validation failed", path=file_path, error=str(e))
         return None
 
 
-def should_send_as_photo(path: Path) -> bool:
+def should_send_as_photo(path: Path, size: Optional[int] = None) -> bool:
     """Return True if the image should be sent via reply_photo().
 
     Raster images ≤ 10 MB are sent as photos (inline preview).
-    SVGs and large files are sent as documents.
+    SVGs and large files are sent as documents. Pass *size* when it is
+    already known (e.g. :attr:`ImageAttachment.size`) to skip the stat call.
     """
     ext = path.suffix.lower()
     if ext not in TELEGRAM_PHOTO_EXTENSIONS:
         return False
 
-    try:
-        return path.stat().st_size <= PHOTO_SIZE_LIMIT
-    except OSError:
-        return False
+    if size is None:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return False
+    return size <= PHOTO_SIZE_LIMIT
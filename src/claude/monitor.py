@@ -1,61 +1,92 @@
 """Bash directory boundary enforcement for Claude tool calls."""
 
+import functools
+import os
+import re
 import shlex
 from pathlib import Path
-from typing import Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 # Subdirectories under ~/.claude/ that Claude Code uses internally.
-_CLAUDE_INTERNAL_SUBDIRS: Set[str] = {"plans", "todos", "settings.json"}
+_CLAUDE_INTERNAL_SUBDIRS: FrozenSet[str] = frozenset(
+    {"plans", "todos", "settings.json"}
+)
 
 # Commands that modify the filesystem or change context and should have paths checked
-_FS_MODIFYING_COMMANDS: Set[str] = {
-    "mkdir",
-    "touch",
-    "cp",
-    "mv",
-    "rm",
-    "rmdir",
-    "ln",
-    "install",
-    "tee",
-    "cd",
-}
+_FS_MODIFYING_COMMANDS: FrozenSet[str] = frozenset(
+    {
+        "mkdir",
+        "touch",
+        "cp",
+        "mv",
+        "rm",
+        "rmdir",
+        "ln",
+        "install",
+        "tee",
+        "cd",
+    }
+)
 
 # Commands that are read-only or don't take filesystem paths
-_READ_ONLY_COMMANDS: Set[str] = {
-    "cat",
-    "ls",
-    "head",
-    "tail",
-    "less",
-    "more",
-    "which",
-    "whoami",
-    "pwd",
-    "echo",
-    "printf",
-    "env",
-    "printenv",
-    "date",
-    "wc",
-    "sort",
-    "uniq",
-    "diff",
-    "file",
-    "stat",
-    "du",
-    "df",
-    "tree",
-    "realpath",
-    "dirname",
-    "basename",
-}
+_READ_ONLY_COMMANDS: FrozenSet[str] = frozenset(
+    {
+        "cat",
+        "ls",
+        "head",
+        "tail",
+        "less",
+        "more",
+        "which",
+        "whoami",
+        "pwd",
+        "echo",
+        "printf",
+        "env",
+        "printenv",
+        "date",
+        "wc",
+        "sort",
+        "uniq",
+        "diff",
+        "file",
+        "stat",
+        "du",
+        "df",
+        "tree",
+        "realpath",
+        "dirname",
+        "basename",
+    }
+)
 
 # Actions / expressions that make ``find`` a filesystem-modifying command
-_FIND_MUTATING_ACTIONS: Set[str] = {"-delete", "-exec", "-execdir", "-ok", "-okdir"}
+_FIND_MUTATING_ACTIONS: FrozenSet[str] = frozenset(
+    {"-delete", "-exec", "-execdir", "-ok", "-okdir"}
+)
 
 # Bash command separators
-_COMMAND_SEPARATORS: Set[str] = {"&&", "||", ";", "|", "&"}
+_COMMAND_SEPARATORS: FrozenSet[str] = frozenset({"&&", "||", ";", "|", "&"})
+# First characters of the separators; most tokens fail this cheaper test
+_SEPARATOR_FIRST_CHARS: FrozenSet[str] = frozenset("&|;")
+
+# Without quotes or escapes, shlex.split (posix, no comments) only splits
+# on its whitespace characters, which a regex does without the lexer setup.
+_SHLEX_SPECIAL_CHARS = frozenset("'\"\\")
+_SHLEX_WORD_RE = re.compile(r"[^ \t\r\n]+")
+
+
+def _split_command(command: str) -> List[str]:
+    """Split *command* exactly like ``shlex.split``, cheaply when unquoted."""
+    if _SHLEX_SPECIAL_CHARS.isdisjoint(command):
+        return _SHLEX_WORD_RE.findall(command)
+    return shlex.split(command)
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_directory(directory: Path) -> Path:
+    """Resolve an approved directory once; it is fixed for the process lifetime."""
+    return directory.resolve()
 
 
 def check_bash_directory_boundary(
@@ -64,8 +95,20 @@ def check_bash_directory_boundary(
     approved_directory: Path,
 ) -> Tuple[bool, Optional[str]]:
     """Check if a bash command's paths stay within the approved directory."""
+    # A single unquoted command (no separators) that starts with a read-only
+    # word needs no further work; only its first word has to be found.
+    if _SHLEX_SPECIAL_CHARS.isdisjoint(command) and _SEPARATOR_FIRST_CHARS.isdisjoint(
+        command
+    ):
+        head = _SHLEX_WORD_RE.search(command)
+        if head is None:
+            return True, None
+        first = head.group()
+        if (Path(first).name if "/" in first else first) in _READ_ONLY_COMMANDS:
+            return True, None
+
     try:
-        tokens = shlex.split(command)
+        tokens = _split_command(command)
     except ValueError:
         # If we can't parse the command, let it through —
         # the sandbox will catch it at the OS level
@@ -79,7 +122,7 @@ def check_bash_directory_boundary(
     current_chain: list[str] = []
 
     for token in tokens:
-        if token in _COMMAND_SEPARATORS:
+        if token[:1] in _SEPARATOR_FIRST_CHARS and token in _COMMAND_SEPARATORS:
             if current_chain:
                 command_chains.append(current_chain)
             current_chain = []
@@ -89,14 +132,22 @@ def check_bash_directory_boundary(
     if current_chain:
         command_chains.append(current_chain)
 
-    resolved_approved = approved_directory.resolve()
+    resolved_approved = _resolve_directory(approved_directory)
+    approved_str = str(resolved_approved)
+    # The separator keeps /a/b from matching /a/bc
+    approved_prefix = approved_str.rstrip(os.sep) + os.sep
+    working_dir_str = str(working_directory)
+    resolved_working_dir: Optional[str] = None  # realpath'd on first use
 
     # Check each command in the chain
     for cmd_tokens in command_chains:
         if not cmd_tokens:
             continue
 
-        base_command = Path(cmd_tokens[0]).name
+        # Bare command words are their own basename; only build a Path for
+        # tokens with a directory part
+        first = cmd_tokens[0]
+        base_command = Path(first).name if "/" in first else first
 
         # Read-only commands are always allowed
         if base_command in _READ_ONLY_COMMANDS:
@@ -123,11 +174,23 @@ def check_bash_directory_boundary(
             # caught instead of being silently allowed.
             try:
                 if token.startswith("/"):
-                    resolved = Path(token).resolve()
+                    resolved = os.path.realpath(token)
+                elif "/" not in token and token not in (".", ".."):
+                    # A plain name resolves to <real cwd>/<name> unless the
+                    # name itself is a symlink, so one lstat replaces a
+                    # realpath walk over every working-directory component.
+                    if resolved_working_dir is None:
+                        resolved_working_dir = os.path.realpath(working_dir_str)
+                    candidate = os.path.join(resolved_working_dir, token)
+                    if os.path.islink(candidate):
+                        candidate = os.path.realpath(candidate)
+                    resolved = candidate
                 else:
-                    resolved = (working_directory / token).resolve()
+                    resolved = os.path.realpath(os.path.join(working_dir_str, token))
 
-                if not _is_within_directory(resolved, resolved_approved):
+                if resolved != approved_str and not resolved.startswith(
+                    approved_prefix
+                ):
                     return False, (
                         f"Directory boundary violation: '{base_command}' targets "
                         f"'{token}' which is outside approved directory "
@@ -161,12 +224,3 @@ def _is_claude_internal_path(file_path: str) -> bool:
 
     except Exception:
         return False
-
-
-def _is_within_directory(path: Path, directory: Path) -> bool:
-    """Check if path is within directory."""
-    try:
-        path.relative_to(directory)
-        return True
-    except ValueError:
-        return False
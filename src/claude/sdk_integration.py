@@ -4,7 +4,7 @@ import asyncio
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 import structlog
 from claude_agent_sdk import (
@@ -40,6 +40,12 @@ from .monitor import _is_claude_internal_path, check_bash_directory_boundary
 
 logger = structlog.get_logger()
 
+# Tool names checked by the can_use_tool permission callback
+_FILE_TOOLS: FrozenSet[str] = frozenset(
+    {"Write", "Edit", "Read", "create_file", "edit_file", "read_file"}
+)
+_BASH_TOOLS: FrozenSet[str] = frozenset({"Bash", "bash", "shell"})
+
 
 @dataclass
 class ClaudeResponse:
@@ -76,8 +82,6 @@ def _make_can_use_tool_callback(
     The callback validates file path boundaries and bash directory boundaries
     *before* the SDK executes the tool, providing preventive security enforcement.
     """
-    _FILE_TOOLS = {"Write", "Edit", "Read", "create_file", "edit_file", "read_file"}
-    _BASH_TOOLS = {"Bash", "bash", "shell"}
 
     async def can_use_tool(
         tool_name: str,
@@ -6,12 +6,17 @@ delivery is handled by the bot's stream callback which intercepts the tool
 call.
 """
 
-from pathlib import Path
+import os
 
 from mcp.server.fastmcp import FastMCP
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".svg"}
 
+# str.endswith takes a tuple; the "/"-prefixed forms catch dotfiles such as
+# "/tmp/.png", which have no suffix at all.
+_IMAGE_EXT_TUPLE = tuple(sorted(IMAGE_EXTENSIONS))
+_BARE_EXT_NAME_TUPLE = tuple("/" + ext for ext in _IMAGE_EXT_TUPLE)
+
 mcp = FastMCP("telegram")
 
 
@@ -26,21 +31,23 @@ async def send_image_to_user(file_path: str, caption: str = "") -> str:
     Returns:
         Confirmation string when the image is queued for delivery.
     """
-    path = Path(file_path)
-
-    if not path.is_absolute():
+    if not os.path.isabs(file_path):
         return f"Error: path must be absolute, got '{file_path}'"
 
-    if path.suffix.lower() not in IMAGE_EXTENSIONS:
+    fp_lower = file_path.lower()
+    if not fp_lower.endswith(_IMAGE_EXT_TUPLE) or fp_lower.endswith(
+        _BARE_EXT_NAME_TUPLE
+    ):
+        suffix = os.path.splitext(file_path)[1]
         return (
-            f"Error: unsupported image extension '{path.suffix}'. "
-            f"Supported: {', '.join(sorted(IMAGE_EXTENSIONS))}"
+            f"Error: unsupported image extension '{suffix}'. "
+            f"Supported: {', '.join(_IMAGE_EXT_TUPLE)}"
         )
 
-    if not path.is_file():
+    if not os.path.isfile(file_path):
         return f"Error: file not found: {file_path}"
 
-    return f"Image queued for delivery: {path.name}"
+    return f"Image queued for delivery: {os.path.basename(file_path)}"
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """YAML-backed project registry for thread mode."""
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -22,17 +23,22 @@ class ProjectRegistry:
     """In-memory validated project registry."""
 
     def __init__(self, projects: List[ProjectDefinition]) -> None:
-        self._projects = projects
+        # The registry never changes after loading, so both views are
+        # built once and handed out as immutable tuples.
+        self._projects: Tuple[ProjectDefinition, ...] = tuple(projects)
+        self._enabled: Tuple[ProjectDefinition, ...] = tuple(
+            p for p in projects if p.enabled
+        )
         self._by_slug: Dict[str, ProjectDefinition] = {p.slug: p for p in projects}
 
     @property
-    def projects(self) -> List[ProjectDefinition]:
+    def projects(self) -> Tuple[ProjectDefinition, ...]:
         """Return all projects."""
-        return list(self._projects)
+        return self._projects
 
-    def list_enabled(self) -> List[ProjectDefinition]:
+    def list_enabled(self) -> Tuple[ProjectDefinition, ...]:
         """Return enabled projects only."""
-        return [p for p in self._projects if p.enabled]
+        return self._enabled
 
     def get_by_slug(self, slug: str) -> Optional[ProjectDefinition]:
         """Get project by slug."""
@@ -57,6 +63,9 @@ def load_project_registry(
         raise ValueError("Projects config must contain a non-empty 'projects' list")
 
     approved_root = approved_directory.resolve()
+    # Trailing separator so "/a/b" does not contain "/a/bc"; the root itself
+    # is allowed, matching Path.relative_to semantics.
+    approved_prefix = str(approved_root).rstrip(os.sep) + os.sep
     seen_slugs = set()
     seen_names = set()
     seen_rel_paths = set()
@@ -84,14 +93,13 @@ def load_project_registry(
 
         absolute_path = (approved_root / rel_path).resolve()
 
-        try:
-            absolute_path.relative_to(approved_root)
-        except ValueError as e:
+        if not (str(absolute_path) + os.sep).startswith(approved_prefix):
             raise ValueError(
                 f"Project '{slug}' path outside approved " f"directory: {rel_path_raw}"
-            ) from e
+            )
 
-        if not absolute_path.exists() or not absolute_path.is_dir():
+        # is_dir() is False for missing paths too, so one stat covers both
+        if not absolute_path.is_dir():
             raise ValueError(
                 f"Project '{slug}' path does not exist or "
                 f"is not a directory: {absolute_path}"
@@ -1,9 +1,11 @@
 """Telegram forum topic synchronization and project resolution."""
 
 import asyncio
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from time import monotonic
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Awaitable, Callable, Optional, Set, Tuple, TypeVar
 
 import structlog
 from telegram import Bot
@@ -17,12 +19,75 @@ from .registry import ProjectDefinition, ProjectRegistry
 logger = structlog.get_logger()
 T = TypeVar("T")
 
+# Projects reconciled at once during sync_topics
+_SYNC_CONCURRENCY = 4
+
+# Thread -> project resolutions are reused until a sync or this TTL expires.
+# Misses are never cached, so a newly mapped topic is routed immediately.
+_RESOLVE_CACHE_TTL_SECONDS = 60.0
+_RESOLVE_CACHE_SIZE = 512
+_ResolveEntry = Tuple[float, ProjectDefinition]
+
+# Telegram error texts, each matched case-insensitively in one regex scan
+_PRIVATE_TOPICS_UNAVAILABLE_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "topics are not enabled",
+            "topic_closed",
+            "topic deleted",
+            "forum topics are disabled",
+            "direct messages topic",
+            "chat is not a forum",
+        )
+    ),
+    re.IGNORECASE,
+)
+_TOPIC_UNUSABLE_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "topic deleted",
+            "topic was deleted",
+            "topic_closed",
+            "topic closed",
+            "message thread not found",
+            "thread not found",
+            "invalid message thread id",
+            "forum topic not found",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+def _build_guidance_message(context_label: str) -> str:
+    """Guidance text for strict routing rejections in the given context."""
+    return (
+        "🚫 <b>Project Thread Required</b>\n\n"
+        "This bot is configured for strict project threads.\n"
+        f"Please send commands in a {context_label}.\n\n"
+        "If topics are missing or stale, run <code>/sync_threads</code>."
+    )
+
+
+# Routing rejections are frequent and their text is fixed per mode
+_GUIDANCE_GROUP = _build_guidance_message("mapped project forum topic")
+_GUIDANCE_PRIVATE = _build_guidance_message("mapped project topic in this private chat")
+_PRIVATE_TOPICS_UNAVAILABLE_MESSAGE = (
+    "❌ <b>Private Topics Unavailable</b>\n\n"
+    "This bot requires topics in private chat, "
+    "but topics are not available.\n\n"
+    "Enable topics for this bot chat in Telegram, then run "
+    "<code>/sync_threads</code>."
+)
+
 
 class PrivateTopicsUnavailableError(RuntimeError):
     """Raised when private chat topics are unavailable/disabled."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicSyncResult:
     """Summary of a synchronization run."""
 
@@ -51,58 +116,55 @@ class ProjectThreadManager:
         self.sync_action_interval_seconds = max(0.0, sync_action_interval_seconds)
         self._sync_api_lock = asyncio.Lock()
         self._last_sync_api_call_at: Optional[float] = None
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+        # (chat_id, message_thread_id) -> (cached_at, project), oldest first
+        self._resolve_cache: "OrderedDict[Tuple[int, int], _ResolveEntry]" = (
+            OrderedDict()
+        )
 
     async def sync_topics(self, bot: Bot, chat_id: int) -> TopicSyncResult:
         """Create/reconcile topics for all enabled projects."""
+        # Mappings (and, via /sync_threads, the registry) change during a
+        # sync, so cached resolutions are dropped on both sides of it.
+        self._resolve_cache.clear()
+        try:
+            return await self._sync_topics(bot, chat_id)
+        finally:
+            self._resolve_cache.clear()
+
+    async def _sync_topics(self, bot: Bot, chat_id: int) -> TopicSyncResult:
+        """Run one topic synchronization pass."""
         result = TopicSyncResult()
 
         enabled = self.registry.list_enabled()
         active_slugs = [project.slug for project in enabled]
 
-        for project in enabled:
-            try:
-                existing = await self.repository.get_by_chat_project(
-                    chat_id,
-                    project.slug,
-                )
-
-                if existing:
-                    handled = await self._sync_existing_mapping(
-                        bot=bot,
-                        project=project,
-                        mapping=existing,
-                        result=result,
-                    )
-                    if handled:
-                        continue
+        existing_by_slug = await self.repository.get_many_by_chat_project(
+            chat_id, active_slugs
+        )
 
-                await self._create_and_map_topic(
+        # Projects sync concurrently so their DB writes overlap; Telegram
+        # calls stay serialized and paced by _call_sync_api.
+        semaphore = asyncio.Semaphore(_SYNC_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(
+                self._sync_project_topic(
                     bot=bot,
                     project=project,
                     chat_id=chat_id,
+                    existing=existing_by_slug.get(project.slug),
                     result=result,
+                    semaphore=semaphore,
                 )
-
-            except TelegramError as e:
-                if self._is_private_topics_unavailable_error(e):
-                    raise PrivateTopicsUnavailableError(
-                        "Private chat topics are not enabled for this bot chat."
-                    ) from e
-                result.failed += 1
-                logger.error(
-                    "Failed to sync project topic",
-                    project_slug=project.slug,
-                    chat_id=chat_id,
-                    error=str(e),
-                )
-            except Exception as e:
-                result.failed += 1
-                logger.error(
-                    "Failed to sync project topic",
-                    project_slug=project.slug,
-                    chat_id=chat_id,
-                    error=str(e),
-                )
+            )
+            for project in enabled
+        ]
+        # Let every project finish even if one fails, so a topic created
+        # mid-flight still gets its mapping row; then surface the failure.
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
 
         stale_mappings = await self.repository.list_stale_active_mappings(
             chat_id=chat_id,
@@ -138,8 +200,64 @@ class ProjectThreadManager:
                 )
                 result.deactivated += 1
 
+        await self.drain_background_tasks()
         return result
 
+    async def drain_background_tasks(self) -> None:
+        """Wait for pending topic bootstrap messages to be sent."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _sync_project_topic(
+        self,
+        bot: Bot,
+        project: ProjectDefinition,
+        chat_id: int,
+        existing: Optional[ProjectThreadModel],
+        result: TopicSyncResult,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Create or reconcile the topic for a single project."""
+        async with semaphore:
+            try:
+                if existing:
+                    handled = await self._sync_existing_mapping(
+                        bot=bot,
+                        project=project,
+                        mapping=existing,
+                        result=result,
+                    )
+                    if handled:
+                        return
+
+                await self._create_and_map_topic(
+                    bot=bot,
+                    project=project,
+                    chat_id=chat_id,
+                    result=result,
+                )
+
+            except TelegramError as e:
+                if self._is_private_topics_unavailable_error(e):
+                    raise PrivateTopicsUnavailableError(
+                        "Private chat topics are not enabled for this bot chat."
+                    ) from e
+                result.failed += 1
+                logger.error(
+                    "Failed to sync project topic",
+                    project_slug=project.slug,
+                    chat_id=chat_id,
+                    error=str(e),
+                )
+            except Exception as e:
+                result.failed += 1
+                logger.error(
+                    "Failed to sync project topic",
+                    project_slug=project.slug,
+                    chat_id=chat_id,
+                    error=str(e),
+                )
+
     async def _call_sync_api(
         self,
         call: Callable[[], Awaitable[T]],
@@ -199,26 +317,29 @@ class ProjectThreadManager:
             if rename_status == "unusable":
                 return False
             if rename_status == "failed":
-                await self.repository.upsert_mapping(
-                    project_slug=project.slug,
-                    chat_id=chat_id,
-                    message_thread_id=mapping.message_thread_id,
-                    topic_name=mapping.topic_name,
-                    is_active=True,
-                )
+                if not mapping.is_active:
+                    await self.repository.upsert_mapping(
+                        project_slug=project.slug,
+                        chat_id=chat_id,
+                        message_thread_id=mapping.message_thread_id,
+                        topic_name=mapping.topic_name,
+                        is_active=True,
+                    )
                 result.failed += 1
                 result.reused += 1
                 return True
             topic_name = project.name
             result.renamed += 1
 
-        await self.repository.upsert_mapping(
-            project_slug=project.slug,
-            chat_id=chat_id,
-            message_thread_id=mapping.message_thread_id,
-            topic_name=topic_name,
-            is_active=True,
-        )
+        # An active mapping that already carries this name needs no write
+        if topic_name != mapping.topic_name or not mapping.is_active:
+            await self.repository.upsert_mapping(
+                project_slug=project.slug,
+                chat_id=chat_id,
+                message_thread_id=mapping.message_thread_id,
+                topic_name=topic_name,
+                is_active=True,
+            )
         result.reused += 1
         return True
 
@@ -244,12 +365,18 @@ class ProjectThreadManager:
             topic_name=project.name,
             is_active=True,
         )
-        await self._send_topic_bootstrap_message(
-            bot=bot,
-            chat_id=chat_id,
-            message_thread_id=topic.message_thread_id,
-            project_name=project.name,
+        # The bootstrap message is cosmetic; send it in the background so
+        # the next project does not wait on it. It logs its own failures.
+        task = asyncio.create_task(
+            self._send_topic_bootstrap_message(
+                bot=bot,
+                chat_id=chat_id,
+                message_thread_id=topic.message_thread_id,
+                project_name=project.name,
+            )
         )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
         result.created += 1
 
     async def _ensure_topic_usable(self, bot: Bot, mapping: ProjectThreadModel) -> str:
@@ -306,6 +433,27 @@ class ProjectThreadManager:
         self, chat_id: int, message_thread_id: int
     ) -> Optional[ProjectDefinition]:
         """Resolve mapped project for chat+thread."""
+        key = (chat_id, message_thread_id)
+        now = monotonic()
+        cached = self._resolve_cache.get(key)
+        if cached is not None and now - cached[0] < _RESOLVE_CACHE_TTL_SECONDS:
+            self._resolve_cache.move_to_end(key)
+            return cached[1]
+
+        project = await self._lookup_project(chat_id, message_thread_id)
+        if project is None:
+            self._resolve_cache.pop(key, None)
+            return None
+        self._resolve_cache[key] = (now, project)
+        self._resolve_cache.move_to_end(key)
+        if len(self._resolve_cache) > _RESOLVE_CACHE_SIZE:
+            self._resolve_cache.popitem(last=False)
+        return project
+
+    async def _lookup_project(
+        self, chat_id: int, message_thread_id: int
+    ) -> Optional[ProjectDefinition]:
+        """Look up the enabled project mapped to chat+thread."""
         mapping = await self.repository.get_by_chat_thread(chat_id, message_thread_id)
         if not mapping:
             return None
@@ -319,42 +467,17 @@ class ProjectThreadManager:
     @staticmethod
     def guidance_message(mode: str = "group") -> str:
         """Guidance text for strict routing rejections."""
-        context_label = (
-            "mapped project topic in this private chat"
-            if mode == "private"
-            else "mapped project forum topic"
-        )
-        return (
-            "🚫 <b>Project Thread Required</b>\n\n"
-            "This bot is configured for strict project threads.\n"
-            f"Please send commands in a {context_label}.\n\n"
-            "If topics are missing or stale, run <code>/sync_threads</code>."
-        )
+        return _GUIDANCE_PRIVATE if mode == "private" else _GUIDANCE_GROUP
 
     @staticmethod
     def private_topics_unavailable_message() -> str:
         """User guidance when private chat topics are unavailable."""
-        return (
-            "❌ <b>Private Topics Unavailable</b>\n\n"
-            "This bot requires topics in private chat, "
-            "but topics are not available.\n\n"
-            "Enable topics for this bot chat in Telegram, then run "
-            "<code>/sync_threads</code>."
-        )
+        return _PRIVATE_TOPICS_UNAVAILABLE_MESSAGE
 
     @staticmethod
     def _is_private_topics_unavailable_error(error: TelegramError) -> bool:
         """Return True for Telegram errors indicating topics are unavailable."""
-        text = str(error).lower()
-        markers = [
-            "topics are not enabled",
-            "topic_closed",
-            "topic deleted",
-            "forum topics are disabled",
-            "direct messages topic",
-            "chat is not a forum",
-        ]
-        return any(marker in text for marker in markers)
+        return _PRIVATE_TOPICS_UNAVAILABLE_RE.search(str(error)) is not None
 
     async def _rename_topic(
         self,
@@ -417,15 +540,4 @@ class ProjectThreadManager:
     @staticmethod
     def _is_topic_unusable_error(error: TelegramError) -> bool:
         """Return True when topic no longer exists or thread id is invalid."""
-        text = str(error).lower()
-        markers = [
-            "topic deleted",
-            "topic was deleted",
-            "topic_closed",
-            "topic closed",
-            "message thread not found",
-            "thread not found",
-            "invalid message thread id",
-            "forum topic not found",
-        ]
-        return any(marker in text for marker in markers)
+        return _TOPIC_UNUSABLE_RE.search(str(error)) is not None
@@ -7,9 +7,10 @@ Features:
 - Input sanitization
 """
 
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import structlog
 
@@ -110,6 +111,10 @@ class SecurityValidator:
         ".psql_history",
     }
 
+    _FORBIDDEN_FILENAMES_LOWER: FrozenSet[str] = frozenset(
+        name.lower() for name in FORBIDDEN_FILENAMES
+    )
+
     # Dangerous file patterns
     DANGEROUS_FILE_PATTERNS = [
         r".*\.key$",  # Key files
@@ -131,6 +136,19 @@ class SecurityValidator:
         r".*\.rar$",  # Archives (potentially dangerous)
     ]
 
+    # Compiled once per class; the source pattern is kept for error messages
+    _DANGEROUS_PATTERN_RES: List[Tuple[str, "re.Pattern[str]"]] = [
+        (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in DANGEROUS_PATTERNS
+    ]
+    _DANGEROUS_FILE_PATTERN_RES: List[Tuple[str, "re.Pattern[str]"]] = [
+        (pattern, re.compile(pattern, re.IGNORECASE))
+        for pattern in DANGEROUS_FILE_PATTERNS
+    ]
+    # All DANGEROUS_PATTERNS as one alternation, so clean input takes one scan
+    _DANGEROUS_ANY_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in DANGEROUS_PATTERNS), re.IGNORECASE
+    )
+
     def __init__(
         self, approved_directory: Path, disable_security_patterns: bool = False
     ):
@@ -160,18 +178,18 @@ class SecurityValidator:
 
             # Check for dangerous patterns (unless explicitly disabled)
             if not self.disable_security_patterns:
-                for pattern in self.DANGEROUS_PATTERNS:
-                    if re.search(pattern, user_path, re.IGNORECASE):
-                        logger.warning(
-                            "Dangerous pattern detected in path",
-                            path=user_path,
-                            pattern=pattern,
-                        )
-                        return (
-                            False,
-                            None,
-                            f"Invalid path: contains forbidden pattern '{pattern}'",
-                        )
+                pattern = self._find_dangerous_pattern(user_path)
+                if pattern is not None:
+                    logger.warning(
+                        "Dangerous pattern detected in path",
+                        path=user_path,
+                        pattern=pattern,
+                    )
+                    return (
+                        False,
+                        None,
+                        f"Invalid path: contains forbidden pattern '{pattern}'",
+                    )
 
             # Handle path resolution
             current_dir = current_dir or self.approved_directory
@@ -207,13 +225,24 @@ class SecurityValidator:
             logger.error("Path validation error", path=user_path, error=str(e))
             return False, None, f"Invalid path: {str(e)}"
 
+    def _find_dangerous_pattern(self, text: str) -> Optional[str]:
+        """Return the first DANGEROUS_PATTERNS entry found in text, if any."""
+        if not self._DANGEROUS_ANY_RE.search(text):
+            return None
+        # Rare path: name the first matching pattern for logs and errors
+        for pattern, regex in self._DANGEROUS_PATTERN_RES:
+            if regex.search(text):
+                return pattern
+        return None
+
     def _is_within_directory(self, path: Path, directory: Path) -> bool:
-        """Check if path is within directory."""
-        try:
-            path.relative_to(directory)
-            return True
-        except ValueError:
-            return False
+        """Check if path is within directory (both already resolved)."""
+        path_str = str(path)
+        dir_str = str(directory)
+        # The separator keeps /a/b from matching /a/bc
+        return path_str == dir_str or path_str.startswith(
+            dir_str.rstrip(os.sep) + os.sep
+        )
 
     def validate_filename(self, filename: str) -> Tuple[bool, Optional[str]]:
         """Validate uploaded filename.
@@ -233,21 +262,21 @@ class SecurityValidator:
             return False, "Invalid filename: contains path separators"
 
         # Check for forbidden patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, filename, re.IGNORECASE):
-                logger.warning(
-                    "Dangerous pattern in filename", filename=filename, pattern=pattern
-                )
-                return False, "Invalid filename: contains forbidden pattern"
+        pattern = self._find_dangerous_pattern(filename)
+        if pattern is not None:
+            logger.warning(
+                "Dangerous pattern in filename", filename=filename, pattern=pattern
+            )
+            return False, "Invalid filename: contains forbidden pattern"
 
         # Check for forbidden filenames
-        if filename.lower() in {name.lower() for name in self.FORBIDDEN_FILENAMES}:
+        if filename.lower() in self._FORBIDDEN_FILENAMES_LOWER:
             logger.warning("Forbidden filename", filename=filename)
             return False, f"Forbidden filename: {filename}"
 
         # Check for dangerous file patterns
-        for pattern in self.DANGEROUS_FILE_PATTERNS:
-            if re.match(pattern, filename, re.IGNORECASE):
+        for pattern, regex in self._DANGEROUS_FILE_PATTERN_RES:
+            if regex.match(filename):
                 logger.warning(
                     "Dangerous file pattern", filename=filename, pattern=pattern
                 )
@@ -325,12 +354,12 @@ class SecurityValidator:
 
         for arg in args:
             # Check for dangerous patterns
-            for pattern in self.DANGEROUS_PATTERNS:
-                if re.search(pattern, arg, re.IGNORECASE):
-                    logger.warning(
-                        "Dangerous pattern in command arg", arg=arg, pattern=pattern
-                    )
-                    return False, [], "Invalid argument: contains forbidden pattern"
+            pattern = self._find_dangerous_pattern(arg)
+            if pattern is not None:
+                logger.warning(
+                    "Dangerous pattern in command arg", arg=arg, pattern=pattern
+                )
+                return False, [], "Invalid argument: contains forbidden pattern"
 
             # Sanitize argument
             sanitized = self.sanitize_command_input(arg)
@@ -354,16 +383,15 @@ class SecurityValidator:
         dirname = dirname.strip()
 
         # Check for dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, dirname, re.IGNORECASE):
-                return False
+        if self._DANGEROUS_ANY_RE.search(dirname):
+            return False
 
         # Check for path separators
         if "/" in dirname or "\\" in dirname:
             return False
 
         # Check for forbidden names
-        if dirname.lower() in {name.lower() for name in self.FORBIDDEN_FILENAMES}:
+        if dirname.lower() in self._FORBIDDEN_FILENAMES_LOWER:
             return False
 
         # Check for hidden directories
@@ -94,20 +94,25 @@ class Storage:
 
         message_id = await self.messages.save_message(message)
 
-        # Save tool usage
+        # Save tool usage (one batch and commit for the whole response)
         if response.tools_used:
-            for tool in response.tools_used:
-                tool_usage = ToolUsageModel(
-                    id=None,
-                    session_id=session_id,
-                    message_id=message_id,
-                    tool_name=tool["name"],
-                    tool_input=tool.get("input", {}),
-                    timestamp=datetime.now(UTC),
-                    success=not response.is_error,
-                    error_message=response.error_type if response.is_error else None,
-                )
-                await self.tools.save_tool_usage(tool_usage)
+            timestamp = datetime.now(UTC)
+            error_message = response.error_type if response.is_error else None
+            await self.tools.save_tool_usages(
+                [
+                    ToolUsageModel(
+                        id=None,
+                        session_id=session_id,
+                        message_id=message_id,
+                        tool_name=tool["name"],
+                        tool_input=tool.get("input", {}),
+                        timestamp=timestamp,
+                        success=not response.is_error,
+                        error_message=error_message,
+                    )
+                    for tool in response.tools_used
+                ]
+            )
 
         # Update cost tracking
         await self.costs.update_daily_cost(user_id, response.cost)
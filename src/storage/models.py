@@ -103,7 +103,7 @@ class SessionModel:
         return age.total_seconds() > (timeout_hours * 3600)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectThreadModel:
     """Project-thread mapping data model."""
 
@@ -265,6 +265,26 @@ class ProjectThreadRepository:
             row = await cursor.fetchone()
             return ProjectThreadModel.from_row(row) if row else None
 
+    async def get_many_by_chat_project(
+        self, chat_id: int, project_slugs: List[str]
+    ) -> Dict[str, ProjectThreadModel]:
+        """Find mappings for several project slugs in one chat, keyed by slug."""
+        if not project_slugs:
+            return {}
+
+        async with self.db.get_connection() as conn:
+            placeholders = ",".join("?" for _ in project_slugs)
+            cursor = await conn.execute(
+                f"""
+                SELECT * FROM project_threads
+                WHERE chat_id = ? AND project_slug IN ({placeholders})
+            """,
+                [chat_id] + project_slugs,
+            )
+            rows = await cursor.fetchall()
+            mappings = [ProjectThreadModel.from_row(row) for row in rows]
+            return {mapping.project_slug: mapping for mapping in mappings}
+
     async def upsert_mapping(
         self,
         project_slug: str,
@@ -465,37 +485,53 @@ class MessageRepository:
 class ToolUsageRepository:
     """Tool usage data access."""
 
+    _INSERT_TOOL_USAGE_SQL = """
+        INSERT INTO tool_usage
+        (session_id, message_id, tool_name, tool_input,
+         timestamp, success, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_manager: DatabaseManager):
         """Initialize repository."""
         self.db = db_manager
 
+    @staticmethod
+    def _tool_usage_params(tool_usage: ToolUsageModel) -> tuple:
+        """Build the INSERT parameters for a tool usage row."""
+        tool_input_json = (
+            json.dumps(tool_usage.tool_input) if tool_usage.tool_input else None
+        )
+        return (
+            tool_usage.session_id,
+            tool_usage.message_id,
+            tool_usage.tool_name,
+            tool_input_json,
+            tool_usage.timestamp,
+            tool_usage.success,
+            tool_usage.error_message,
+        )
+
     async def save_tool_usage(self, tool_usage: ToolUsageModel) -> int:
         """Save tool usage and return ID."""
         async with self.db.get_connection() as conn:
-            tool_input_json = (
-                json.dumps(tool_usage.tool_input) if tool_usage.tool_input else None
-            )
-
             cursor = await conn.execute(
-                """
-                INSERT INTO tool_usage
-                (session_id, message_id, tool_name, tool_input,
-                 timestamp, success, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    tool_usage.session_id,
-                    tool_usage.message_id,
-                    tool_usage.tool_name,
-                    tool_input_json,
-                    tool_usage.timestamp,
-                    tool_usage.success,
-                    tool_usage.error_message,
-                ),
+                self._INSERT_TOOL_USAGE_SQL, self._tool_usage_params(tool_usage)
             )
             await conn.commit()
             return cursor.lastrowid
 
+    async def save_tool_usages(self, tool_usages: List[ToolUsageModel]) -> None:
+        """Save several tool usages in one statement batch and commit."""
+        if not tool_usages:
+            return
+        async with self.db.get_connection() as conn:
+            await conn.executemany(
+                self._INSERT_TOOL_USAGE_SQL,
+                [self._tool_usage_params(t) for t in tool_usages],
+            )
+            await conn.commit()
+
     async def get_session_tool_usage(self, session_id: str) -> List[ToolUsageModel]:
         """Get tool usage for session."""
         async with self.db.get_connection() as conn:
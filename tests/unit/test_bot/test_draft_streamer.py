@@ -134,6 +134,19 @@ class TestDraftStreamerTruncation:
         # The rest should be the tail of the original
         assert sent_text[1:] == long_text[-(4096 - 1) :]
 
+    async def test_truncation_keeps_tail_of_tool_header(self, streamer, mock_bot):
+        """When text alone fits, the tail of the tool header fills the rest."""
+        streamer._tool_lines = ["\U0001f4d6 Read", "\U0001f527 Grep"]
+        text = "z" * (TELEGRAM_MAX_MESSAGE_LENGTH - 5)
+        streamer._accumulated_text = text
+        await streamer.flush()
+
+        full = "\U0001f4d6 Read\n\U0001f527 Grep\n\n" + text
+        call_kwargs = mock_bot.send_message_draft.call_args[1]
+        sent_text = call_kwargs["text"]
+        assert len(sent_text) == TELEGRAM_MAX_MESSAGE_LENGTH
+        assert sent_text == "\u2026" + full[-(TELEGRAM_MAX_MESSAGE_LENGTH - 1) :]
+
     async def test_exact_limit_not_truncated(self, streamer, mock_bot):
         """Text exactly at limit should not be truncated."""
         exact_text = "y" * TELEGRAM_MAX_MESSAGE_LENGTH
@@ -172,6 +185,14 @@ class TestDraftStreamerFlush:
         call_kwargs = mock_bot.send_message_draft.call_args[1]
         assert call_kwargs["text"] == "buffered text"
 
+    async def test_flush_skips_unchanged_draft(self, streamer, mock_bot):
+        """flush() after an identical draft was sent makes no API call."""
+        await streamer.append_text("final text")
+        mock_bot.send_message_draft.reset_mock()
+
+        await streamer.flush()
+        mock_bot.send_message_draft.assert_not_called()
+
     async def test_flush_empty_is_noop(self, streamer, mock_bot):
         """flush() with no accumulated text should be a no-op."""
         await streamer.flush()
@@ -300,6 +321,22 @@ class TestDraftStreamerComposition:
         text = call_kwargs["text"]
         assert "... +" not in text
 
+    async def test_tool_header_reused_until_new_tool(self, streamer, mock_bot):
+        """Text-only updates reuse the rendered tool header."""
+        await streamer.append_tool("\U0001f4d6 Read")
+        header = streamer._tool_header
+        assert header == "\U0001f4d6 Read"
+
+        streamer._last_send_time = 0.0
+        await streamer.append_text("Response")
+        assert streamer._tool_header is header
+
+        await streamer.append_tool("\U0001f527 Grep")
+        assert streamer._tool_header is None
+        await streamer.flush()
+        call_kwargs = mock_bot.send_message_draft.call_args[1]
+        assert call_kwargs["text"] == "\U0001f4d6 Read\n\U0001f527 Grep\n\nResponse"
+
 
 class TestDraftStreamerMidStreamDisable:
     async def test_append_noop_after_mid_stream_disable(self, streamer, mock_bot):
@@ -10,7 +10,12 @@ from src.bot.utils.formatting import (
     ProgressIndicator,
     ResponseFormatter,
 )
-from src.bot.utils.html_format import escape_html, markdown_to_telegram_html
+from src.bot.utils.html_format import (
+    escape_html,
+    is_valid_telegram_html,
+    markdown_to_telegram_html,
+    strip_html_tags,
+)
 from src.config.settings import Settings
 
 
@@ -334,6 +339,49 @@ class TestMarkdownToTelegramHtml:
         assert "<i>italic</i>" in result
 
 
+class TestTelegramHtmlValidation:
+    """Test local HTML validation and stripping."""
+
+    def test_converted_markdown_is_valid(self):
+        text = "**Bold** `a < b` [link](https://x.io/?a=1&b=2)\n```py\nx = 1\n```"
+        assert is_valid_telegram_html(markdown_to_telegram_html(text))
+
+    def test_unclosed_tag_is_invalid(self):
+        assert not is_valid_telegram_html("<pre><code>print(1)")
+
+    def test_misnested_tags_are_invalid(self):
+        assert not is_valid_telegram_html("<b>one <i>two</b></i>")
+
+    def test_unsupported_tag_is_invalid(self):
+        assert not is_valid_telegram_html("<div>block</div>")
+
+    def test_cut_entity_is_invalid(self):
+        assert not is_valid_telegram_html("a &am")
+
+    def test_unsupported_named_entity_is_invalid(self):
+        assert is_valid_telegram_html("&lt;&gt;&amp;&quot;&#39;&#x27;")
+        assert not is_valid_telegram_html("a&nbsp;b")
+
+    def test_unsupported_attribute_is_invalid(self):
+        assert is_valid_telegram_html('<span class="tg-spoiler">x</span>')
+        assert not is_valid_telegram_html('<b style="color:red">x</b>')
+        assert not is_valid_telegram_html('<a onclick="x()">x</a>')
+
+    def test_quote_in_attribute_value_is_invalid(self):
+        assert not is_valid_telegram_html('<a href="https://x.io/"a"">x</a>')
+
+    def test_closing_tag_with_attributes_is_invalid(self):
+        assert not is_valid_telegram_html('<b>x</b class="y">')
+
+    def test_strip_html_tags_unescapes(self):
+        assert strip_html_tags("<b>x &lt; y</b> &amp; z") == "x < y & z"
+
+    def test_formatter_flags_malformed_html(self, formatter):
+        formatter._clean_text = lambda text: text
+        messages = formatter.format_claude_response("<b>unterminated")
+        assert messages[0].validated is False
+
+
 class TestProgressIndicator:
     """Test ProgressIndicator utility functions."""
 
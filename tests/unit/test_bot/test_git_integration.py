@@ -0,0 +1,22 @@
+"""Tests for git integration status parsing."""
+
+import pytest
+
+from src.bot.features.git_integration import GitIntegration
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("main", ("main", 0, 0)),
+        ("main...origin/main", ("main", 0, 0)),
+        ("main...origin/main [ahead 1]", ("main", 1, 0)),
+        ("main...origin/main [behind 4]", ("main", 0, 4)),
+        ("feat/x...origin/feat/x [ahead 2, behind 3]", ("feat/x", 2, 3)),
+        ("main...origin/main [gone]", ("main", 0, 0)),
+        ("No commits yet on main", ("main", 0, 0)),
+        ("HEAD (no branch)", ("HEAD", 0, 0)),
+    ],
+)
+def test_parse_branch_header(header, expected):
+    assert GitIntegration._parse_branch_header(header) == expected
@@ -1,10 +1,12 @@
 """Tests for image validation and Telegram delivery helpers."""
 
+import stat
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import src.bot.utils.image_extractor as image_extractor_module
 from src.bot.utils.image_extractor import (
     IMAGE_EXTENSIONS,
     MAX_FILE_SIZE_BYTES,
@@ -16,6 +18,14 @@ from src.bot.utils.image_extractor import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Keep cached path validations from leaking between tests."""
+    image_extractor_module._validated_paths.clear()
+    yield
+    image_extractor_module._validated_paths.clear()
+
+
 @pytest.fixture
 def work_dir(tmp_path: Path) -> Path:
     """Create a working directory with some image files."""
@@ -65,6 +75,11 @@ class TestShouldSendAsPhoto:
         img = tmp_path / "gone.png"
         assert should_send_as_photo(img) is False
 
+    def test_known_size_skips_stat(self, tmp_path: Path):
+        img = tmp_path / "gone.png"
+        assert should_send_as_photo(img, size=100) is True
+        assert should_send_as_photo(img, size=PHOTO_SIZE_LIMIT + 1) is False
+
 
 # --- Constants ---
 
@@ -115,6 +130,16 @@ class TestValidateImagePath:
         result = validate_image_path(str(img), approved)
         assert result is None
 
+    def test_sibling_with_shared_prefix_rejected(self, tmp_path: Path):
+        approved = tmp_path / "proj"
+        approved.mkdir()
+        sibling = tmp_path / "proj-secrets"
+        sibling.mkdir()
+        img = sibling / "leak.png"
+        img.write_bytes(b"\x00" * 100)
+        result = validate_image_path(str(img), approved)
+        assert result is None
+
     def test_caption_stored_as_original_reference(
         self, work_dir: Path, approved_dir: Path
     ):
@@ -132,12 +157,19 @@ class TestValidateImagePath:
     def test_large_file_rejected(self, work_dir: Path, approved_dir: Path):
         big = work_dir / "huge.png"
         big.write_bytes(b"\x00" * 100)
-        with patch.object(Path, "stat") as mock_stat:
+        with patch("src.bot.utils.image_extractor.os.stat") as mock_stat:
+            mock_stat.return_value.st_mode = stat.S_IFREG | 0o644
             mock_stat.return_value.st_size = MAX_FILE_SIZE_BYTES + 1
-            with patch.object(Path, "is_file", return_value=True):
-                result = validate_image_path(str(big), approved_dir)
+            result = validate_image_path(str(big), approved_dir)
         assert result is None
 
+    def test_directory_with_image_suffix_rejected(
+        self, work_dir: Path, approved_dir: Path
+    ):
+        fake = work_dir / "folder.png"
+        fake.mkdir()
+        assert validate_image_path(str(fake), approved_dir) is None
+
     def test_symlink_escaping_rejected(self, tmp_path: Path):
         approved = tmp_path / "approved"
         approved.mkdir()
@@ -150,6 +182,48 @@ class TestValidateImagePath:
         result = validate_image_path(str(link), approved)
         assert result is None
 
+    def test_repeat_validation_skips_realpath(self, work_dir: Path, approved_dir: Path):
+        img = work_dir / "chart.png"
+        assert validate_image_path(str(img), approved_dir) is not None
+        with patch("src.bot.utils.image_extractor.os.path.realpath") as realpath:
+            result = validate_image_path(str(img), approved_dir, caption="again")
+        realpath.assert_not_called()
+        assert result is not None
+        assert result.original_reference == "again"
+
+    def test_cached_path_swapped_for_symlink_rejected(self, tmp_path: Path):
+        approved = tmp_path / "approved"
+        approved.mkdir()
+        img = approved / "chart.png"
+        img.write_bytes(b"\x00" * 100)
+        assert validate_image_path(str(img), approved) is not None
+
+        outside = tmp_path / "secret.png"
+        outside.write_bytes(b"\x00" * 100)
+        img.unlink()
+        img.symlink_to(outside)
+        assert validate_image_path(str(img), approved) is None
+
+    def test_cached_symlink_retargeted_resolves_new_target(self, tmp_path: Path):
+        approved = tmp_path / "approved"
+        approved.mkdir()
+        first = approved / "first.png"
+        first.write_bytes(b"\x00" * 100)
+        second = approved / "second.png"
+        second.write_bytes(b"\x00" * 200)
+        link = approved / "link.png"
+        link.symlink_to(first)
+        result = validate_image_path(str(link), approved)
+        assert result is not None
+        assert result.path == first.resolve()
+
+        link.unlink()
+        link.symlink_to(second)
+        result = validate_image_path(str(link), approved)
+        assert result is not None
+        assert result.path == second.resolve()
+        assert result.size == 200
+
     def test_all_supported_extensions(self, work_dir: Path, approved_dir: Path):
         """Every extension in IMAGE_EXTENSIONS should be accepted."""
         for ext in IMAGE_EXTENSIONS:
@@ -173,3 +247,4 @@ class TestValidateImagePath:
         assert isinstance(result, ImageAttachment)
         assert result.mime_type == "image/png"
         assert result.original_reference == str(img)
+        assert result.size == 100
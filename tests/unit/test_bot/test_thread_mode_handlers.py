@@ -260,3 +260,17 @@ async def test_sync_threads_group_mode_rejects_non_target_chat(tmp_path: Path):
 
     manager.sync_topics.assert_not_called()
     status_msg.edit_text.assert_called_once()
+
+
+@pytest.mark.parametrize("module", [callback, command])
+def test_is_within_root_rejects_sibling_sharing_prefix(module, tmp_path: Path):
+    root = tmp_path / "project_a"
+    sibling = tmp_path / "project_ab"
+    root.mkdir()
+    sibling.mkdir()
+    (root / "link").symlink_to(sibling)
+
+    assert module._is_within_root(root, root)
+    assert module._is_within_root(root / "src" / "..", root)
+    assert not module._is_within_root(sibling, root)
+    assert not module._is_within_root(root / "link", root)
@@ -1,10 +1,12 @@
 """Test bash directory boundary checking."""
 
+import shlex
 from pathlib import Path
 from unittest.mock import patch
 
 from src.claude.monitor import (
     _is_claude_internal_path,
+    _split_command,
     check_bash_directory_boundary,
 )
 
@@ -31,6 +33,13 @@ class TestCheckBashDirectoryBoundary:
         assert valid
         assert error is None
 
+    def test_sibling_directory_sharing_prefix_blocked(self) -> None:
+        valid, error = check_bash_directory_boundary(
+            "mkdir /root/projects-old/x", self.cwd, self.approved
+        )
+        assert not valid
+        assert "/root/projects-old/x" in error
+
     def test_touch_outside_approved_directory(self) -> None:
         valid, error = check_bash_directory_boundary(
             "touch /tmp/evil.txt", self.cwd, self.approved
@@ -234,6 +243,63 @@ class TestCheckBashDirectoryBoundary:
         assert not valid
         assert "/tmp" in error
 
+    def test_plain_name_symlink_escaping_blocked(self, tmp_path: Path) -> None:
+        approved = tmp_path / "approved"
+        approved.mkdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (approved / "link").symlink_to(outside)
+
+        valid, error = check_bash_directory_boundary(
+            "cp notes.txt link", approved, approved
+        )
+        assert not valid
+        assert "'link'" in error
+
+    def test_plain_names_inside_cwd_pass(self, tmp_path: Path) -> None:
+        approved = tmp_path / "approved"
+        approved.mkdir()
+        (approved / "src").mkdir()
+
+        valid, error = check_bash_directory_boundary(
+            "cp notes.txt src", approved, approved
+        )
+        assert valid
+        assert error is None
+
+    def test_single_read_only_command_skips_tokenizing(self) -> None:
+        with patch("src.claude.monitor._split_command") as split:
+            valid, error = check_bash_directory_boundary(
+                "  /bin/ls -la /etc", self.cwd, self.approved
+            )
+        assert valid
+        assert error is None
+        split.assert_not_called()
+
+    def test_read_only_head_with_separator_still_checked(self) -> None:
+        valid, error = check_bash_directory_boundary(
+            "ls && rm -rf /tmp/x", self.cwd, self.approved
+        )
+        assert not valid
+        assert "/tmp/x" in error
+
+
+class TestSplitCommand:
+    """The unquoted fast path must tokenize exactly like shlex.split."""
+
+    def test_matches_shlex(self) -> None:
+        commands = [
+            "",
+            "   ",
+            "mkdir -p /root/web1",
+            "mkdir newdir; mv file.txt /tmp/",
+            "ls\t-la &&\r\nrm -rf build",
+            "echo a\x0bb # not a comment",
+            "cp 'a b' \"c d\" e\\ f",
+        ]
+        for command in commands:
+            assert _split_command(command) == shlex.split(command), command
+
 
 class TestIsClaudeInternalPath:
     """Test the _is_claude_internal_path helper function."""
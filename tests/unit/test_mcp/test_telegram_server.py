@@ -55,3 +55,9 @@ class TestSendImageToUser:
         img.write_bytes(b"\x00" * 10)
         result = await send_image_to_user(str(img))
         assert "Image queued for delivery" in result
+
+    async def test_extension_only_dotfile_rejected(self, tmp_path: Path) -> None:
+        hidden = tmp_path / ".png"
+        hidden.write_bytes(b"\x00" * 10)
+        result = await send_image_to_user(str(hidden))
+        assert "unsupported" in result
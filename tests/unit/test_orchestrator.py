@@ -7,8 +7,14 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-
-from src.bot.orchestrator import MessageOrchestrator, _redact_secrets
+from telegram.ext import CallbackQueryHandler, CommandHandler, MessageHandler
+
+from src.bot.orchestrator import (
+    _BACKGROUND_WRITE_CONCURRENCY,
+    MessageOrchestrator,
+    _redact_secrets,
+)
+from src.claude.sdk_integration import StreamUpdate
 from src.config import create_test_config
 
 
@@ -91,8 +97,6 @@ def test_agentic_registers_6_commands(agentic_settings, deps):
     orchestrator.register_handlers(app)
 
     # Collect all CommandHandler registrations
-    from telegram.ext import CommandHandler
-
     cmd_handlers = [
         call
         for call in app.add_handler.call_args_list
@@ -117,8 +121,6 @@ def test_classic_registers_14_commands(classic_settings, deps):
 
     orchestrator.register_handlers(app)
 
-    from telegram.ext import CommandHandler
-
     cmd_handlers = [
         call
         for call in app.add_handler.call_args_list
@@ -136,8 +138,6 @@ def test_agentic_registers_text_document_photo_handlers(agentic_settings, deps):
 
     orchestrator.register_handlers(app)
 
-    from telegram.ext import CallbackQueryHandler, MessageHandler
-
     msg_handlers = [
         call
         for call in app.add_handler.call_args_list
@@ -266,6 +266,31 @@ async def test_agentic_status_compact(agentic_settings, deps):
     assert "Session: none" in text
 
 
+async def test_agentic_repo_lists_visible_directories(agentic_settings, deps):
+    """Agentic /repo lists non-hidden directories sorted, marking git repos."""
+    base = agentic_settings.approved_directory
+    (base / "beta").mkdir()
+    (base / "alpha" / ".git").mkdir(parents=True)
+    (base / ".hidden").mkdir()
+    (base / "notes.txt").write_text("x")
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    update = MagicMock()
+    update.message.text = "/repo"
+    update.message.reply_text = AsyncMock()
+
+    context = MagicMock()
+    context.user_data = {}
+
+    await orchestrator.agentic_repo(update, context)
+
+    text = update.message.reply_text.call_args.args[0]
+    assert text.index("alpha/") < text.index("beta/")
+    assert "\U0001f4e6 <code>alpha/</code>" in text
+    assert ".hidden" not in text
+    assert "notes.txt" not in text
+
+
 async def test_agentic_text_calls_claude(agentic_settings, deps):
     """Agentic text handler calls Claude and returns response without keyboard."""
     orchestrator = MessageOrchestrator(agentic_settings, deps)
@@ -330,8 +355,6 @@ async def test_agentic_callback_scoped_to_cd_pattern(agentic_settings, deps):
 
     orchestrator.register_handlers(app)
 
-    from telegram.ext import CallbackQueryHandler
-
     cb_handlers = [
         call[0][0]
         for call in app.add_handler.call_args_list
@@ -367,6 +390,71 @@ async def test_agentic_document_rejects_large_files(agentic_settings, deps):
     assert "too large" in call_args.args[0].lower()
 
 
+async def test_agentic_document_rejects_binary_mime_without_download(
+    agentic_settings, deps
+):
+    """Binary uploads are rejected before the file is downloaded."""
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    document = MagicMock()
+    document.file_name = "photo.png"
+    document.file_size = 1024
+    document.mime_type = "image/png"
+    document.get_file = AsyncMock()
+
+    progress_msg = AsyncMock()
+    update = MagicMock()
+    update.effective_user.id = 123
+    update.message.document = document
+    update.message.chat.send_action = AsyncMock()
+    update.message.reply_text = AsyncMock(return_value=progress_msg)
+
+    context = MagicMock()
+    context.user_data = {}
+    context.bot_data = {"security_validator": None, "features": None}
+
+    await orchestrator.agentic_document(update, context)
+
+    document.get_file.assert_not_called()
+    assert "unsupported file format" in progress_msg.edit_text.call_args.args[0].lower()
+
+
+async def test_agentic_document_accepts_svg_upload(agentic_settings, deps):
+    """Text-based image subtypes such as SVG still reach the text fallback."""
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    document = MagicMock()
+    document.file_name = "logo.svg"
+    document.file_size = 1024
+    document.mime_type = "image/svg+xml"
+    file = MagicMock()
+    file.download_as_bytearray = AsyncMock(return_value=bytearray(b"<svg/>"))
+    document.get_file = AsyncMock(return_value=file)
+
+    progress_msg = AsyncMock()
+    update = MagicMock()
+    update.effective_user.id = 123
+    update.message.document = document
+    update.message.chat.send_action = AsyncMock()
+    update.message.reply_text = AsyncMock(return_value=progress_msg)
+
+    context = MagicMock()
+    context.user_data = {}
+    context.bot_data = {
+        "security_validator": None,
+        "features": None,
+        "claude_integration": None,
+    }
+
+    await orchestrator.agentic_document(update, context)
+
+    document.get_file.assert_awaited_once()
+    assert all(
+        "unsupported file format" not in call.args[0].lower()
+        for call in progress_msg.edit_text.call_args_list
+    )
+
+
 async def test_agentic_voice_calls_claude(agentic_settings, deps):
     """Agentic voice handler transcribes and routes prompt to Claude."""
     orchestrator = MessageOrchestrator(agentic_settings, deps)
@@ -542,13 +630,35 @@ async def test_agentic_text_logs_failure_on_error(agentic_settings, deps):
     }
 
     await orchestrator.agentic_text(update, context)
+    await orchestrator.drain_background_tasks()
 
     # Audit logged with success=False
-    audit_logger.log_command.assert_called_once()
+    audit_logger.log_command.assert_awaited_once()
     call_kwargs = audit_logger.log_command.call_args
     assert call_kwargs.kwargs["success"] is False
 
 
+async def test_background_writes_respect_concurrency_limit(agentic_settings, deps):
+    """Background writes beyond the cap wait for a free slot."""
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    running = 0
+    peak = 0
+
+    async def write() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    for _ in range(_BACKGROUND_WRITE_CONCURRENCY * 3):
+        orchestrator._run_in_background(write(), "write failed")
+    await orchestrator.drain_background_tasks()
+
+    assert peak == _BACKGROUND_WRITE_CONCURRENCY
+
+
 # --- _redact_secrets / _summarize_tool_input tests ---
 
 
@@ -608,23 +718,31 @@ class TestRedactSecrets:
         result = _redact_secrets(cmd)
         assert "secret_password" not in result
 
-    def test_summarize_tool_input_bash_redacts(self, agentic_settings, deps):
-        """_summarize_tool_input applies redaction to Bash commands."""
-        orchestrator = MessageOrchestrator(agentic_settings, deps)
-        result = orchestrator._summarize_tool_input(
-            "Bash",
-            {"command": "curl --token=mysupersecrettoken123 https://api.example.com"},
-        )
-        assert "mysupersecrettoken123" not in result
-        assert "***" in result
-
-    def test_summarize_tool_input_non_bash_unchanged(self, agentic_settings, deps):
-        """Non-Bash tools don't go through redaction."""
+    @pytest.mark.parametrize(
+        "tool_name,tool_input,check",
+        [
+            # Bash commands go through redaction
+            (
+                "Bash",
+                {
+                    "command": "curl --token=mysupersecrettoken123 "
+                    "https://api.example.com"
+                },
+                lambda r: "mysupersecrettoken123" not in r and "***" in r,
+            ),
+            # Non-Bash tools don't go through redaction
+            ("Read", {"file_path": "/home/user/.env"}, lambda r: r == ".env"),
+            # A known tool missing its usual key uses the generic summary
+            ("Task", {"prompt": "Find bugs"}, lambda r: r == "Find bugs"),
+        ],
+    )
+    def test_summarize_tool_input(
+        self, agentic_settings, deps, tool_name, tool_input, check
+    ):
+        """_summarize_tool_input summarizes each tool as expected."""
         orchestrator = MessageOrchestrator(agentic_settings, deps)
-        result = orchestrator._summarize_tool_input(
-            "Read", {"file_path": "/home/user/.env"}
-        )
-        assert result == ".env"
+        result = orchestrator._summarize_tool_input(tool_name, tool_input)
+        assert check(result), result
 
 
 # --- Typing heartbeat tests ---
@@ -636,13 +754,19 @@ class TestTypingHeartbeat:
     async def test_heartbeat_sends_typing_action(self, agentic_settings, deps):
         """Heartbeat sends typing actions at the configured interval."""
         chat = AsyncMock()
-        chat.send_action = AsyncMock()
+        fired_twice = asyncio.Event()
+
+        async def send_action(action: str) -> None:
+            if chat.send_action.call_count >= 2:
+                fired_twice.set()
+
+        chat.send_action = AsyncMock(side_effect=send_action)
 
         orchestrator = MessageOrchestrator(agentic_settings, deps)
-        heartbeat = orchestrator._start_typing_heartbeat(chat, interval=0.05)
+        heartbeat = orchestrator._start_typing_heartbeat(chat, interval=0.001)
 
-        # Let the heartbeat fire a few times
-        await asyncio.sleep(0.2)
+        # Wait until the heartbeat has fired a few times
+        await asyncio.wait_for(fired_twice.wait(), timeout=1.0)
         heartbeat.cancel()
         try:
             await heartbeat
@@ -672,18 +796,20 @@ class TestTypingHeartbeat:
         """Heartbeat keeps running even if send_action raises."""
         chat = AsyncMock()
         call_count = [0]
+        recovered = asyncio.Event()
 
         async def flaky_send_action(action: str) -> None:
             call_count[0] += 1
             if call_count[0] <= 2:
                 raise Exception("Network error")
+            recovered.set()
 
         chat.send_action = flaky_send_action
 
         orchestrator = MessageOrchestrator(agentic_settings, deps)
-        heartbeat = orchestrator._start_typing_heartbeat(chat, interval=0.05)
+        heartbeat = orchestrator._start_typing_heartbeat(chat, interval=0.001)
 
-        await asyncio.sleep(0.3)
+        await asyncio.wait_for(recovered.wait(), timeout=1.0)
         heartbeat.cancel()
         try:
             await heartbeat
@@ -715,6 +841,89 @@ class TestTypingHeartbeat:
         assert "chat" not in sig.parameters
 
 
+async def test_stream_callback_does_not_wait_for_progress_edit(agentic_settings, deps):
+    """A slow progress edit runs in the background, not on the stream path."""
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    release = asyncio.Event()
+
+    async def slow_edit(*args, **kwargs):
+        await release.wait()
+
+    progress_msg = MagicMock()
+    progress_msg.edit_text = AsyncMock(side_effect=slow_edit)
+    tool_log: list = []  # type: ignore[type-arg]
+    callback = orchestrator._make_stream_callback(
+        verbose_level=1,
+        progress_msg=progress_msg,
+        tool_log=tool_log,
+        start_time=0.0,
+    )
+    update = StreamUpdate(
+        type="assistant",
+        tool_calls=[{"name": "Read", "input": {"file_path": "/tmp/a.py"}}],
+    )
+
+    await asyncio.wait_for(callback(update), timeout=1.0)
+    await asyncio.sleep(0)
+    progress_msg.edit_text.assert_called_once()
+
+    release.set()
+    await asyncio.sleep(0)
+
+
+async def test_stop_cancels_pending_progress_edit(agentic_settings, deps):
+    """Stopping cancels an in-flight progress edit before showing Stopping..."""
+    from src.bot.orchestrator import ActiveRequest
+
+    orchestrator = MessageOrchestrator(agentic_settings, deps)
+
+    edit_started = asyncio.Event()
+    edit_cancelled = asyncio.Event()
+
+    async def slow_edit(text, **kwargs):
+        if text == "Stopping...":
+            return
+        edit_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            edit_cancelled.set()
+            raise
+
+    progress_msg = MagicMock()
+    progress_msg.edit_text = AsyncMock(side_effect=slow_edit)
+    callback = orchestrator._make_stream_callback(
+        verbose_level=1,
+        progress_msg=progress_msg,
+        tool_log=[],
+        start_time=0.0,
+    )
+    await callback(
+        StreamUpdate(
+            type="assistant",
+            tool_calls=[{"name": "Read", "input": {"file_path": "/tmp/a.py"}}],
+        )
+    )
+    await asyncio.wait_for(edit_started.wait(), timeout=1.0)
+
+    orchestrator._active_requests[123] = ActiveRequest(
+        user_id=123, progress_msg=progress_msg
+    )
+    query = MagicMock()
+    query.data = "stop:123"
+    query.from_user.id = 123
+    query.answer = AsyncMock()
+    update = MagicMock()
+    update.callback_query = query
+
+    await orchestrator._handle_stop_callback(update, MagicMock())
+
+    assert edit_cancelled.is_set()
+    assert progress_msg.edit_text.call_args.args[0] == "Stopping..."
+    assert orchestrator._progress_edits == {}
+
+
 async def test_group_thread_mode_rejects_non_forum_chat(group_thread_settings, deps):
     """Strict thread mode rejects updates outside configured forum chat."""
     orchestrator = MessageOrchestrator(group_thread_settings, deps)
@@ -72,3 +72,42 @@ def test_load_project_registry_rejects_outside_approved_dir(tmp_path: Path) -> N
         load_project_registry(config_file, approved)
 
     assert "outside approved directory" in str(exc_info.value)
+
+
+def test_load_project_registry_rejects_sibling_with_shared_prefix(
+    tmp_path: Path,
+) -> None:
+    approved = tmp_path / "projects"
+    approved.mkdir()
+    (tmp_path / "projects-private").mkdir()
+
+    config_file = tmp_path / "projects.yaml"
+    config_file.write_text(
+        "projects:\n"
+        "  - slug: app\n"
+        "    name: App\n"
+        "    path: ../projects-private\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        load_project_registry(config_file, approved)
+
+    assert "outside approved directory" in str(exc_info.value)
+
+
+def test_project_registry_views_are_immutable(tmp_path: Path) -> None:
+    approved = tmp_path / "projects"
+    approved.mkdir()
+    (approved / "app1").mkdir()
+
+    config_file = tmp_path / "projects.yaml"
+    config_file.write_text(
+        "projects:\n" "  - slug: app1\n" "    name: App 1\n" "    path: app1\n",
+        encoding="utf-8",
+    )
+
+    registry = load_project_registry(config_file, approved)
+
+    assert isinstance(registry.projects, tuple)
+    assert registry.list_enabled() is registry.list_enabled()
@@ -1,5 +1,6 @@
 """Tests for project-thread manager."""
 
+import asyncio
 import tempfile
 from pathlib import Path
 from types import SimpleNamespace
@@ -100,6 +101,66 @@ async def test_resolve_project_by_mapping(tmp_path: Path, db_manager) -> None:
     assert project.slug == "app1"
 
 
+async def test_resolve_project_cached_until_sync(tmp_path: Path, db_manager) -> None:
+    approved = tmp_path / "projects"
+    approved.mkdir()
+
+    config_file = _write_registry(tmp_path, approved, "app1")
+    registry = load_project_registry(config_file, approved)
+
+    repo = ProjectThreadRepository(db_manager)
+    await repo.upsert_mapping(
+        project_slug="app1",
+        chat_id=42,
+        message_thread_id=555,
+        topic_name="App1",
+        is_active=True,
+    )
+    lookup_spy = AsyncMock(wraps=repo.get_by_chat_thread)
+    repo.get_by_chat_thread = lookup_spy
+
+    manager = ProjectThreadManager(registry, repo, sync_action_interval_seconds=0.0)
+    first = await manager.resolve_project(42, 555)
+    second = await manager.resolve_project(42, 555)
+
+    assert first is not None and first is second
+    assert lookup_spy.await_count == 1
+
+    bot = AsyncMock()
+    await manager.sync_topics(bot, chat_id=42)
+    await manager.resolve_project(42, 555)
+
+    assert lookup_spy.await_count == 2
+
+
+async def test_resolve_project_does_not_cache_misses(
+    tmp_path: Path, db_manager
+) -> None:
+    """A mapping created after a failed lookup resolves without a sync."""
+    approved = tmp_path / "projects"
+    approved.mkdir()
+
+    config_file = _write_registry(tmp_path, approved, "app1")
+    registry = load_project_registry(config_file, approved)
+
+    repo = ProjectThreadRepository(db_manager)
+    manager = ProjectThreadManager(registry, repo, sync_action_interval_seconds=0.0)
+
+    assert await manager.resolve_project(42, 555) is None
+
+    await repo.upsert_mapping(
+        project_slug="app1",
+        chat_id=42,
+        message_thread_id=555,
+        topic_name="App1",
+        is_active=True,
+    )
+    project = await manager.resolve_project(42, 555)
+
+    assert project is not None
+    assert project.slug == "app1"
+
+
 async def test_sync_deactivates_stale_projects(tmp_path: Path, db_manager) -> None:
     approved = tmp_path / "projects"
     approved.mkdir()
@@ -154,6 +215,38 @@ async def test_sync_deactivates_stale_projects(tmp_path: Path, db_manager) -> No
     )
 
 
+async def test_sync_topics_failure_does_not_stop_other_projects(
+    tmp_path: Path, db_manager
+) -> None:
+    """One failing project is counted while the others still sync."""
+    approved = tmp_path / "projects"
+    approved.mkdir()
+
+    config_file = _write_registry(tmp_path, approved, "app1,app2,app3")
+    registry = load_project_registry(config_file, approved)
+
+    repo = ProjectThreadRepository(db_manager)
+    manager = ProjectThreadManager(registry, repo, sync_action_interval_seconds=0.0)
+
+    bot = AsyncMock()
+    bot.create_forum_topic = AsyncMock(
+        side_effect=[
+            SimpleNamespace(message_thread_id=101),
+            TelegramError("boom"),
+            SimpleNamespace(message_thread_id=103),
+        ]
+    )
+    bot.send_message = AsyncMock()
+
+    result = await manager.sync_topics(bot, chat_id=42)
+    mappings = await repo.list_by_chat(42, active_only=False)
+
+    assert result.created == 2
+    assert result.failed == 1
+    assert bot.create_forum_topic.await_count == 3
+    assert len(mappings) == 2
+
+
 async def test_sync_private_topics_unavailable_raises(
     tmp_path: Path, db_manager
 ) -> None:
@@ -176,6 +269,47 @@ async def test_sync_private_topics_unavailable_raises(
         await manager.sync_topics(bot, chat_id=123456)
 
 
+async def test_sync_private_topics_unavailable_keeps_in_flight_mappings(
+    tmp_path: Path, db_manager
+) -> None:
+    """A topic created before another project fails still gets its mapping."""
+    approved = tmp_path / "projects"
+    approved.mkdir()
+
+    config_file = _write_registry(tmp_path, approved, "app1,app2")
+    registry = load_project_registry(config_file, approved)
+
+    repo = ProjectThreadRepository(db_manager)
+    manager = ProjectThreadManager(registry, repo, sync_action_interval_seconds=0.0)
+
+    # app1 sits between create_forum_topic and upsert_mapping until app2 fails
+    app2_failed = asyncio.Event()
+    upsert_mapping = repo.upsert_mapping
+
+    async def delayed_upsert(**kwargs):
+        await app2_failed.wait()
+        return await upsert_mapping(**kwargs)
+
+    repo.upsert_mapping = delayed_upsert  # type: ignore[method-assign]
+
+    async def create_forum_topic(*, chat_id, name):
+        if name == "App2":
+            app2_failed.set()
+            raise TelegramError("Bad Request: topics are not enabled in the chat")
+        return SimpleNamespace(message_thread_id=101)
+
+    bot = AsyncMock()
+    bot.create_forum_topic = AsyncMock(side_effect=create_forum_topic)
+    bot.send_message = AsyncMock()
+
+    with pytest.raises(PrivateTopicsUnavailableError):
+        await manager.sync_topics(bot, chat_id=123456)
+
+    mapping = await repo.get_by_chat_project(123456, "app1")
+    assert mapping is not None
+    assert mapping.message_thread_id == 101
+
+
 async def test_sync_renames_existing_topic_and_updates_mapping(
     tmp_path: Path, db_manager
 ) -> None:
@@ -286,10 +420,14 @@ async def test_sync_reused_mapping_skips_rename_when_name_matches(
     bot.reopen_forum_topic = AsyncMock()
     bot.edit_forum_topic = AsyncMock()
 
+    upsert_spy = AsyncMock(wraps=repo.upsert_mapping)
+    repo.upsert_mapping = upsert_spy
+
     result = await manager.sync_topics(bot, chat_id=42)
 
     assert result.reused == 1
     bot.edit_forum_topic.assert_not_called()
+    upsert_spy.assert_not_awaited()
 
 
 async def test_sync_create_sends_bootstrap_message(tmp_path: Path, db_manager) -> None:
@@ -319,6 +457,33 @@ async def test_sync_create_sends_bootstrap_message(tmp_path: Path, db_manager) -
     assert kwargs["message_thread_id"] == 101
 
 
+async def test_sync_bootstrap_failure_does_not_fail_topic(
+    tmp_path: Path, db_manager
+) -> None:
+    """Bootstrap messages run in the background and only log their failures."""
+    approved = tmp_path / "projects"
+    approved.mkdir()
+
+    config_file = _write_registry(tmp_path, approved, "app1")
+    registry = load_project_registry(config_file, approved)
+
+    repo = ProjectThreadRepository(db_manager)
+    manager = ProjectThreadManager(registry, repo, sync_action_interval_seconds=0.0)
+
+    bot = AsyncMock()
+    bot.create_forum_topic = AsyncMock(
+        return_value=SimpleNamespace(message_thread_id=101)
+    )
+    bot.send_message = AsyncMock(side_effect=TelegramError("send failed"))
+
+    result = await manager.sync_topics(bot, chat_id=42)
+
+    assert result.created == 1
+    assert result.failed == 0
+    bot.send_message.assert_awaited_once()
+    assert not manager._background_tasks
+
+
 async def test_sync_recreates_active_mapping_when_topic_unusable(
     tmp_path: Path, db_manager
 ) -> None:
@@ -543,3 +708,28 @@ async def test_sync_topics_does_not_retry_retry_after(
     assert result.failed == 1
     assert bot.create_forum_topic.await_count == 1
     sleep_mock.assert_not_awaited()
+
+
+def test_topic_error_classifiers_match_case_insensitively() -> None:
+    """Marker matching ignores case and rejects unrelated errors."""
+    manager_cls = ProjectThreadManager
+
+    assert manager_cls._is_private_topics_unavailable_error(
+        TelegramError("Bad Request: Chat is not a FORUM")
+    )
+    assert manager_cls._is_topic_unusable_error(
+        TelegramError("Bad Request: Message Thread Not Found")
+    )
+    assert not manager_cls._is_private_topics_unavailable_error(
+        TelegramError("Bad Request: message is too long")
+    )
+    assert not manager_cls._is_topic_unusable_error(TelegramError("rename failed"))
+
+
+def test_guidance_message_depends_on_mode() -> None:
+    private = ProjectThreadManager.guidance_message("private")
+    group = ProjectThreadManager.guidance_message()
+
+    assert "mapped project topic in this private chat" in private
+    assert "mapped project forum topic" in group
+    assert "/sync_threads" in ProjectThreadManager.private_topics_unavailable_message()
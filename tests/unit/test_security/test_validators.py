@@ -118,6 +118,13 @@ class TestSecurityValidator:
             assert valid is False
             assert "forbidden pattern" in error
 
+    def test_dangerous_pattern_reported_in_list_order(self, validator):
+        """The combined screen still reports the first listed pattern."""
+        # ';' (listed before '>') appears after '>' in the input
+        valid, path, error = validator.validate_path("out > x; y")
+        assert valid is False
+        assert error == "Invalid path: contains forbidden pattern ';'"
+
     def test_dangerous_patterns_can_be_disabled(self, temp_approved_dir):
         """Dangerous pattern checks can be disabled for trusted environments."""
         validator = SecurityValidator(temp_approved_dir, disable_security_patterns=True)
@@ -325,6 +325,30 @@ class TestProjectThreadRepository:
         assert lookup is not None
         assert lookup.project_slug == "app1"
 
+    async def test_get_many_by_chat_project(self, project_thread_repo):
+        """Bulk lookup returns existing mappings keyed by slug."""
+        for slug, thread_id in (("app1", 111), ("app2", 222)):
+            await project_thread_repo.upsert_mapping(
+                project_slug=slug,
+                chat_id=-1001234567890,
+                message_thread_id=thread_id,
+                topic_name=slug,
+            )
+        await project_thread_repo.upsert_mapping(
+            project_slug="app1",
+            chat_id=42,
+            message_thread_id=999,
+            topic_name="other chat",
+        )
+
+        mappings = await project_thread_repo.get_many_by_chat_project(
+            -1001234567890, ["app1", "app3"]
+        )
+
+        assert list(mappings) == ["app1"]
+        assert mappings["app1"].message_thread_id == 111
+        assert await project_thread_repo.get_many_by_chat_project(42, []) == {}
+
     async def test_deactivate_missing_projects(self, project_thread_repo):
         """Mappings not in active set are deactivated."""
         await project_thread_repo.upsert_mapping(
@@ -448,6 +472,43 @@ class TestToolUsageRepository:
         assert usage_records[0].tool_name == "Read"
         assert usage_records[0].tool_input["file_path"] == "/test/file.py"
 
+    async def test_save_tool_usages_batch(self, tool_repo, session_repo, user_repo):
+        """Test saving several tool usages in one batch."""
+        user = UserModel(
+            user_id=12355,
+            telegram_username="batchuser",
+            first_seen=datetime.now(UTC),
+            last_active=datetime.now(UTC),
+            is_allowed=True,
+        )
+        await user_repo.create_user(user)
+
+        session = SessionModel(
+            session_id="batch-session",
+            user_id=12355,
+            project_path="/test/batch",
+            created_at=datetime.now(UTC),
+            last_used=datetime.now(UTC),
+        )
+        await session_repo.create_session(session)
+
+        await tool_repo.save_tool_usages(
+            [
+                ToolUsageModel(
+                    session_id="batch-session",
+                    tool_name=name,
+                    tool_input={"file_path": f"/test/{name}.py"},
+                    timestamp=datetime.now(UTC),
+                    success=True,
+                )
+                for name in ("Read", "Edit")
+            ]
+        )
+        await tool_repo.save_tool_usages([])
+
+        usage_records = await tool_repo.get_session_tool_usage("batch-session")
+        assert sorted(u.tool_name for u in usage_records) == ["Edit", "Read"]
+
     async def test_get_tool_stats(self, tool_repo, session_repo, user_repo):
         """Test getting tool statistics."""
         # Setup user and session